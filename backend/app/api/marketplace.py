@@ -356,12 +356,13 @@ async def use_purchased_inference(purchase_id: str, input_data: dict):
         
         listing = db.get_listing(purchase.get("listing_id"))
         
-        # Create job ID for on-chain anchoring
-        job_id_temp = f"job-{purchase_id}-{datetime.utcnow().timestamp()}"
+        # Job ID for on-chain anchoring; the job record is stored under the same id
+        # so the background anchor can write its tx hash/status back to it
+        job_id = f"job-{purchase_id}-{datetime.utcnow().timestamp()}"
         
         # Run inference with on-chain anchoring
         result = inference_engine.run_inference(
-            job_id=job_id_temp,
+            job_id=job_id,
             model_id=model_id,
             model_type=model.get("model_type", "classification"),
             input_data=input_data,
@@ -371,6 +372,7 @@ async def use_purchased_inference(purchase_id: str, input_data: dict):
         
         # Create job record
         job_data = {
+            "id": job_id,
             "model_id": model_id,
             "user_id": purchase.get("user_id"),
             "input_data": input_data,
@@ -411,14 +413,14 @@ async def use_purchased_inference(purchase_id: str, input_data: dict):
             if proof_verified:
                 proof_hash = result.get("proof", {}).get("proof_hash")
                 escrow_release_result = await escrow_service.release_escrow(
-                    job_id=job_id_temp,
+                    job_id=job_id,
                     proof_hash=proof_hash
                 )
                 escrow_released = escrow_release_result.get("success", False)
             else:
                 # Verification failed - initiate refund
                 escrow_release_result = await escrow_service.refund_escrow(
-                    job_id=job_id_temp,
+                    job_id=job_id,
                     reason="ZK proof verification failed"
                 )
         else:
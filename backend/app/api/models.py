@@ -6,6 +6,7 @@ Now with IPFS decentralized storage support!
 from fastapi import APIRouter, UploadFile, File, Form, HTTPException
 from typing import Optional, List
 import os
+import asyncio
 import shutil
 import tempfile
 from pathlib import Path
@@ -13,6 +14,7 @@ from pathlib import Path
 from ..core.database import db
 from ..models.schemas import AIModel, AIModelCreate, APIResponse
 from ..services.ipfs_service import ipfs_service
+from ..services.zkml_simulator import quantize_onnx_model
 
 router = APIRouter(prefix="/models", tags=["Models"])
 
@@ -75,6 +77,11 @@ async def upload_model(
         
         file_size = os.path.getsize(local_file_path)
         
+        # Build the INT8 variant once; inference prefers it when present
+        int8_path = None
+        if file_ext == ".onnx":
+            int8_path = await asyncio.to_thread(quantize_onnx_model, str(local_file_path))
+        
         # IPFS Upload
         ipfs_result = None
         if use_ipfs:
@@ -102,6 +109,8 @@ async def upload_model(
                 "file_size_mb": round(file_size / (1024 * 1024), 2)
             }
         }
+        if int8_path:
+            update_data["metadata"]["int8_path"] = int8_path
         
         # Add IPFS info if available
         if ipfs_result and ipfs_result.get("success"):
@@ -1,6 +1,8 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
 from pydantic import BaseModel
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+import asyncio
+import time
 import uuid
 from datetime import datetime
 from app.core.database import db
@@ -10,6 +12,57 @@ router = APIRouter(tags=["training"])
 # We will now use 'db' which persists to storage/jobs.json
 # and for coordination, we'll prefix job IDs to distinguish if needed
 
+# Long-poll support: new shards in this process wake only as many waiting workers
+# as there are shards; waiters also re-check jobs.json each second for other writers
+_shards_available = asyncio.Condition()
+
+async def _notify_shards_available(count: int):
+    async with _shards_available:
+        _shards_available.notify(count)
+
+# Worker mailbox: the pending shards as a flat list, rebuilt only when jobs.json
+# changes, so a mailbox poll is a version check instead of a scan of every job
+_mailbox: List[Dict[str, Any]] = []
+_mailbox_version: Optional[str] = None
+
+# Shard refs handed to one worker are leased to it for a while, so concurrent
+# mailbox polls get disjoint shards instead of racing to claim the same ones.
+# (job_id, shard_index) -> (worker_id, lease expiry on the monotonic clock)
+MAILBOX_LEASE_S = 15.0
+_mailbox_leases: Dict[Tuple[str, int], Tuple[str, float]] = {}
+
+def _pending_shards() -> List[Dict[str, Any]]:
+    global _mailbox, _mailbox_version, _mailbox_leases
+    version = db.file_version(db.jobs_file)
+    if version != _mailbox_version:
+        _mailbox = [
+            {"job_id": job["id"], "shard_index": shard["shard_index"]}
+            for job in db._read_file(db.jobs_file)
+            if job.get("status") in ("sharding", "processing")
+            for shard in job.get("shards", [])
+            if shard.get("status") == "pending"
+        ]
+        _mailbox_version = version
+        # Claimed/completed shards left the mailbox; their leases go with them
+        pending = {(ref["job_id"], ref["shard_index"]) for ref in _mailbox}
+        _mailbox_leases = {k: v for k, v in _mailbox_leases.items() if k in pending}
+    return _mailbox
+
+def _lease_shards(worker_id: str, limit: int) -> List[Dict[str, Any]]:
+    """Up to `limit` pending shard refs not leased to another worker, leased to this one"""
+    now = time.monotonic()
+    leased = []
+    for ref in _pending_shards():
+        key = (ref["job_id"], ref["shard_index"])
+        holder = _mailbox_leases.get(key)
+        if holder and holder[0] != worker_id and holder[1] > now:
+            continue
+        _mailbox_leases[key] = (worker_id, now + MAILBOX_LEASE_S)
+        leased.append(ref)
+        if len(leased) >= limit:
+            break
+    return leased
+
 class TrainingJobCreate(BaseModel):
     requester: str
     script_url: str
@@ -51,15 +104,54 @@ async def create_training_job(job: TrainingJobCreate):
     
     # Persist to database
     db.create_job(job_data)
+    await _notify_shards_available(len(shards))
     
     return {"message": "Job created and sharded", "job_id": job_id, "shards_count": 10}
 
 @router.get("/training/jobs")
-async def list_training_jobs():
-    """List all training jobs and their shard status"""
-    # Filtering for training type jobs if needed, but for now return all
+async def list_training_jobs(request: Request, response: Response, status: Optional[str] = None):
+    """
+    List all training jobs and their shard status
+    - status: optional comma-separated filter (e.g. "sharding,processing")
+    - Honors If-None-Match: returns 304 while jobs.json is unchanged
+    """
+    etag = f'"{db.file_version(db.jobs_file)}:{status or "*"}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    
     jobs = db._read_file(db.jobs_file)
-    return [j for j in jobs if j.get('type') == 'training' or 'shards' in j]
+    statuses = set(status.split(",")) if status else None
+    return [
+        j for j in jobs
+        if (j.get('type') == 'training' or 'shards' in j)
+        and (statuses is None or j.get('status') in statuses)
+    ]
+
+@router.get("/training/mailbox")
+async def worker_mailbox(worker_id: str, limit: int = 1, wait: float = 0.0):
+    """
+    Next claimable shard refs for a worker ({"shards": [{job_id, shard_index}]},
+    at most `limit`, capped at 64). Returned refs are leased to `worker_id` for
+    MAILBOX_LEASE_S, so other workers' polls skip them. With `wait` > 0 this is
+    a long-poll: it answers as soon as work appears, or 204 after `wait`
+    seconds (capped at 60)
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + min(max(wait, 0.0), 60.0)
+    while True:
+        leased = _lease_shards(worker_id, min(max(limit, 1), 64))
+        if leased:
+            return {"shards": leased}
+        
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            return Response(status_code=204)
+        try:
+            async with _shards_available:
+                await asyncio.wait_for(_shards_available.wait(), timeout=min(1.0, remaining))
+        except asyncio.TimeoutError:
+            pass
 
 @router.get("/training/jobs/{job_id}")
 async def get_training_job(job_id: str):
@@ -79,6 +171,8 @@ async def claim_shard(job_id: str, shard_index: int, worker_id: str):
     if shard_index >= len(job["shards"]):
         raise HTTPException(status_code=400, detail="Invalid shard index")
     
+    # Records from db are shallow copies: copy the shards before editing them
+    job["shards"] = [dict(s) for s in job["shards"]]
     shard = job["shards"][shard_index]
     if shard["status"] != "pending":
         raise HTTPException(status_code=400, detail="Shard already claimed or completed")
@@ -93,6 +187,48 @@ async def claim_shard(job_id: str, shard_index: int, worker_id: str):
     db.update_job(job_id, {"shards": job["shards"], "status": job["status"]})
     return {"message": "Shard claimed successfully", "shard_id": shard["shard_id"]}
 
+class ShardRef(BaseModel):
+    job_id: str
+    shard_index: int
+
+class ShardBatchClaim(BaseModel):
+    worker_id: str
+    shards: List[ShardRef]
+
+@router.post("/training/claim-shards-batch")
+async def claim_shards_batch(claim: ShardBatchClaim):
+    """
+    Claim several shards in one round-trip (one read + one write of jobs.json)
+    Shards that are unknown or no longer pending are reported in `rejected`
+    """
+    jobs = db._read_file(db.jobs_file)
+    by_id = {j["id"]: j for j in jobs}
+    claimed, rejected = [], []
+    
+    for ref in claim.shards:
+        job = by_id.get(ref.job_id)
+        if not job or not (0 <= ref.shard_index < len(job.get("shards", []))):
+            rejected.append({"job_id": ref.job_id, "shard_index": ref.shard_index, "reason": "not_found"})
+            continue
+        shard = job["shards"][ref.shard_index]
+        if shard["status"] != "pending":
+            rejected.append({"job_id": ref.job_id, "shard_index": ref.shard_index, "reason": "already_claimed"})
+            continue
+        
+        # Records from db are shallow copies: replace the shard instead of editing it
+        shard = dict(shard)
+        job["shards"] = job["shards"][:ref.shard_index] + [shard] + job["shards"][ref.shard_index + 1:]
+        shard["status"] = "processing"
+        shard["worker_id"] = claim.worker_id
+        # If all shards are claimed, update job status
+        if all(s["status"] != "pending" for s in job["shards"]):
+            job["status"] = "processing"
+        claimed.append({"job_id": ref.job_id, "shard_index": ref.shard_index, "shard_id": shard["shard_id"]})
+    
+    if claimed:
+        db._write_file(db.jobs_file, jobs)
+    return {"claimed": claimed, "rejected": rejected}
+
 @router.post("/training/submit-shard")
 async def submit_shard(job_id: str, shard_index: int, worker_id: str, result_url: str):
     """Worker submits results for a shard"""
@@ -100,6 +236,8 @@ async def submit_shard(job_id: str, shard_index: int, worker_id: str, result_url
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     
+    # Records from db are shallow copies: copy the shards before editing them
+    job["shards"] = [dict(s) for s in job["shards"]]
     shard = job["shards"][shard_index]
     
     if shard["worker_id"] != worker_id:
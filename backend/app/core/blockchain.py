@@ -4,9 +4,11 @@ Based on NeuralLex BlockchainConnector implementation
 Handles interaction with the Shardeum EVM testnet smart contract
 """
 from web3 import Web3
+from contextlib import contextmanager
 from datetime import datetime
 from typing import Dict, Any, Optional
 import hashlib
+import threading
 
 from .config import (
     SHARDEUM_RPC_URL,
@@ -19,6 +21,31 @@ from .config import (
 )
 
 
+class NonceManager:
+    """
+    Hands out consecutive nonces per signer
+    The anchor (background thread) and escrow (event loop) paths share PRIVATE_KEY;
+    each reads get_transaction_count on its own, so concurrent sends could pick
+    the same nonce. Build, sign and send inside reserve() to serialize them.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._next: Dict[str, int] = {}
+    
+    @contextmanager
+    def reserve(self, w3: Web3, address: str):
+        with self._lock:
+            # The node's pending count wins if something else sent from this key
+            nonce = max(self._next.get(address, 0), w3.eth.get_transaction_count(address, 'pending'))
+            yield nonce
+            # Only advance once the send went through; on error the next caller resyncs
+            self._next[address] = nonce + 1
+
+
+signer_nonces = NonceManager()
+
+
 class BlockchainService:
     """
     Connects to Shardeum EVM testnet and interacts with V-Inference smart contract
@@ -132,9 +159,6 @@ class BlockchainService:
             except Exception as check_error:
                 print(f"Warning: Could not check if audit exists: {check_error}")
             
-            # Get current nonce
-            nonce = self.w3.eth.get_transaction_count(self.account.address)
-            
             # Ensure proof_hash is properly formatted
             if not proof_hash.startswith("0x"):
                 proof_hash = "0x" + proof_hash
@@ -155,22 +179,23 @@ class BlockchainService:
             # Get gas price
             gas_price = self.w3.eth.gas_price
             
-            # Build transaction using anchorAudit(proofHash, jobId)
-            tx = self.contract.functions.anchorAudit(
-                proof_bytes32,   # proofHash (bytes32)
-                job_id           # jobId (string)
-            ).build_transaction({
-                'chainId': self.chain_id,
-                'gas': 500000,
-                'gasPrice': gas_price,
-                'nonce': nonce
-            })
-            
-            # Sign transaction
-            signed_tx = self.w3.eth.account.sign_transaction(tx, PRIVATE_KEY)
-            
-            # Send transaction
-            tx_hash = self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
+            with signer_nonces.reserve(self.w3, self.account.address) as nonce:
+                # Build transaction using anchorAudit(proofHash, jobId)
+                tx = self.contract.functions.anchorAudit(
+                    proof_bytes32,   # proofHash (bytes32)
+                    job_id           # jobId (string)
+                ).build_transaction({
+                    'chainId': self.chain_id,
+                    'gas': 500000,
+                    'gasPrice': gas_price,
+                    'nonce': nonce
+                })
+                
+                # Sign transaction
+                signed_tx = self.w3.eth.account.sign_transaction(tx, PRIVATE_KEY)
+                
+                # Send transaction
+                tx_hash = self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
             tx_hex = self.w3.to_hex(tx_hash)
             
             print(f"[INFO] Transaction sent: {tx_hex}")
@@ -9,6 +9,13 @@ DEBUG = True
 HOST = "0.0.0.0"
 PORT = 8000
 
+# CORS: comma-separated frontend origins allowed to call the API
+FRONTEND_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv("FRONTEND_ORIGIN", "http://localhost:3000").split(",")
+    if origin.strip()
+]
+
 # Database (JSON for simplicity)
 STORAGE_PATH = os.path.join(os.path.dirname(__file__), "..", "storage")
 
@@ -4,11 +4,17 @@ JSON-based file storage simulating a database
 """
 import json
 import os
+import tempfile
+import orjson
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 import uuid
 
+# mkstemp creates 0600 files; new data files get the usual 0666 & ~umask instead
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
 
 class Database:
     """Simple JSON file-based database for demo purposes"""
@@ -17,6 +23,10 @@ class Database:
         self.storage_path = Path(storage_path)
         self.storage_path.mkdir(parents=True, exist_ok=True)
         
+        # Parsed file contents keyed by path, validated by (mtime_ns, size).
+        # Readers get shallow copies of the records (see _read_file).
+        self._cache: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+        
         # Initialize data files
         self.users_file = self.storage_path / "users.json"
         self.models_file = self.storage_path / "models.json"
@@ -25,6 +35,7 @@ class Database:
         self.purchases_file = self.storage_path / "purchases.json"
         self.proofs_file = self.storage_path / "proofs.json"
         self.workers_file = self.storage_path / "workers.json"
+        self.counters_file = self.storage_path / "counters.json"
         
         # Initialize files if they don't exist
         self._init_file(self.users_file, [])
@@ -34,19 +45,113 @@ class Database:
         self._init_file(self.purchases_file, [])
         self._init_file(self.proofs_file, [])
         self._init_file(self.workers_file, [])
+        
+        # Platform counters are maintained on write so stats never rescan.
+        # Each source file's version is stored alongside, so files edited outside
+        # this class (seed/build scripts) are recounted on the next read.
+        self._counted_files = (self.users_file, self.models_file, self.jobs_file)
+        self.get_counters()
     
     def _init_file(self, file_path: Path, default_data: Any):
         if not file_path.exists():
             with open(file_path, 'w') as f:
                 json.dump(default_data, f, indent=2, default=str)
     
+    @staticmethod
+    def _copy_records(data: Any) -> Any:
+        """Fresh list/dict with each top-level record copied (nested values are shared)"""
+        if isinstance(data, list):
+            return [dict(r) if isinstance(r, dict) else r for r in data]
+        if isinstance(data, dict):
+            return dict(data)
+        return data
+    
     def _read_file(self, file_path: Path) -> List[Dict]:
-        with open(file_path, 'r') as f:
-            return json.load(f)
+        """
+        Parsed contents of a storage file, served from the mtime-keyed cache
+        Each call returns shallow copies of the records, so mutating a record
+        never touches the cache; persist changes with _write_file. Nested values
+        (e.g. a job's "shards") are still shared: replace them, don't edit in place.
+        """
+        st = os.stat(file_path)
+        token = (st.st_mtime_ns, st.st_size)
+        key = str(file_path)
+        cached = self._cache.get(key)
+        if cached is None or cached[0] != token:
+            with open(file_path, 'rb') as f:
+                cached = (token, orjson.loads(f.read()))
+            self._cache[key] = cached
+        return self._copy_records(cached[1])
     
     def _write_file(self, file_path: Path, data: List[Dict]):
-        with open(file_path, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
+        self._write_json(file_path, data)
+        
+        if file_path in self._counted_files:
+            self._update_counters({file_path: data})
+    
+    def _write_json(self, file_path: Path, data: Any):
+        payload = orjson.dumps(
+            data,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+                   | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        )
+        # Write to a sibling temp file and rename so readers never see a torn file
+        fd, tmp_path = tempfile.mkstemp(dir=file_path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+            try:
+                mode = os.stat(file_path).st_mode & 0o777
+            except FileNotFoundError:
+                mode = 0o666 & ~_UMASK
+            os.chmod(tmp_path, mode)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        
+        # Our own write is already parsed - no need to reload it on next read.
+        # Cached as a copy: the caller may keep mutating the records it passed in.
+        st = os.stat(file_path)
+        self._cache[str(file_path)] = ((st.st_mtime_ns, st.st_size), self._copy_records(data))
+    
+    def _count_records(self, file_path: Path, data: List[Dict]) -> Dict[str, int]:
+        """Counters derived from one data file (empty for files without counters)"""
+        if file_path == self.users_file:
+            return {"total_users": len(data)}
+        if file_path == self.models_file:
+            return {"total_models": len(data)}
+        if file_path == self.jobs_file:
+            return {
+                "total_inferences": len(data),
+                "completed_inferences": sum(1 for j in data if j.get("status") == "completed"),
+                "verified_inferences": sum(1 for j in data if j.get("status") == "verified" or j.get("proof_hash"))
+            }
+        return {}
+    
+    def _update_counters(self, sources: Dict[Path, List[Dict]]):
+        counters = dict(self._read_file(self.counters_file)) if self.counters_file.exists() else {}
+        versions = dict(counters.get("_versions", {}))
+        for file_path, data in sources.items():
+            counters.update(self._count_records(file_path, data))
+            versions[file_path.name] = self.file_version(file_path)
+        counters["_versions"] = versions
+        self._write_json(self.counters_file, counters)
+        return counters
+    
+    def get_counters(self) -> Dict[str, int]:
+        counters = self._read_file(self.counters_file) if self.counters_file.exists() else {}
+        versions = counters.get("_versions", {})
+        stale = [p for p in self._counted_files if versions.get(p.name) != self.file_version(p)]
+        if stale:
+            counters = self._update_counters({p: self._read_file(p) for p in stale})
+        return {k: v for k, v in counters.items() if k != "_versions"}
+    
+    def file_version(self, file_path: Path) -> str:
+        """Cheap change token for a storage file (mtime_ns + size), usable as an ETag"""
+        st = os.stat(file_path)
+        return f"{st.st_mtime_ns:x}-{st.st_size:x}"
     
     # User operations
     def create_user(self, user_data: Dict) -> Dict:
@@ -264,6 +369,15 @@ class Database:
             if proof.get('job_id') == job_id:
                 return proof
         return None
+    
+    def update_proof_by_job(self, job_id: str, updates: Dict) -> Optional[Dict]:
+        proofs = self._read_file(self.proofs_file)
+        for proof in proofs:
+            if proof.get('job_id') == job_id:
+                proof.update(updates)
+                self._write_file(self.proofs_file, proofs)
+                return proof
+        return None
 
 
 # Global database instance
@@ -4,6 +4,9 @@ Pre-populates the database with demo models and jobs for presentation
 """
 from datetime import datetime, timedelta
 
+# Bump when the demo records below change so existing stores get re-seeded
+SEED_VERSION = 1
+
 
 def seed_demo_data(db):
     """
@@ -335,10 +338,13 @@ def seed_demo_data(db):
             existing_listings.append(listing)
             added_listings += 1
     
-    # Save to files
-    db._write_file(db.models_file, existing_models)
-    db._write_file(db.jobs_file, existing_jobs)
-    db._write_file(db.listings_file, existing_listings)
+    # Save to files (only the ones that changed)
+    if added_models:
+        db._write_file(db.models_file, existing_models)
+    if added_jobs:
+        db._write_file(db.jobs_file, existing_jobs)
+    if added_listings:
+        db._write_file(db.listings_file, existing_listings)
     
     print("[SUCCESS] Demo data seeded successfully!")
     print(f"   [INFO] {added_models} new models added")
@@ -350,3 +356,17 @@ def seed_demo_data(db):
         "jobs_added": added_jobs,
         "listings_added": added_listings
     }
+
+
+def seed_demo_data_once(db):
+    """
+    Seed demo data unless this storage directory was already seeded
+    at the current SEED_VERSION (tracked by a sentinel file)
+    """
+    sentinel = db.storage_path / f".seeded_v{SEED_VERSION}"
+    if sentinel.exists():
+        return None
+    
+    result = seed_demo_data(db)
+    sentinel.touch()
+    return result
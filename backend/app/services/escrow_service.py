@@ -9,6 +9,7 @@ from typing import Dict, Any, Optional
 from datetime import datetime
 from web3 import Web3
 
+from ..core.blockchain import signer_nonces
 from ..core.config import (
     SHARDEUM_RPC_URL, 
     CHAIN_ID, 
@@ -186,22 +187,23 @@ class EscrowService:
             job_bytes = self.job_id_to_bytes32(job_id)
             amount_wei = self.w3.to_wei(amount_eth, 'ether')
             
-            # Build transaction
-            tx = self.contract.functions.createEscrow(
-                job_bytes,
-                Web3.to_checksum_address(provider_address)
-            ).build_transaction({
-                'from': self.account.address,
-                'value': amount_wei,
-                'gas': 150000,
-                'gasPrice': self.w3.eth.gas_price,
-                'nonce': self.w3.eth.get_transaction_count(self.account.address),
-                'chainId': CHAIN_ID
-            })
-            
-            # Sign and send
-            signed = self.w3.eth.account.sign_transaction(tx, PRIVATE_KEY)
-            tx_hash = self.w3.eth.send_raw_transaction(signed.raw_transaction)
+            with signer_nonces.reserve(self.w3, self.account.address) as nonce:
+                # Build transaction
+                tx = self.contract.functions.createEscrow(
+                    job_bytes,
+                    Web3.to_checksum_address(provider_address)
+                ).build_transaction({
+                    'from': self.account.address,
+                    'value': amount_wei,
+                    'gas': 150000,
+                    'gasPrice': self.w3.eth.gas_price,
+                    'nonce': nonce,
+                    'chainId': CHAIN_ID
+                })
+                
+                # Sign and send
+                signed = self.w3.eth.account.sign_transaction(tx, PRIVATE_KEY)
+                tx_hash = self.w3.eth.send_raw_transaction(signed.raw_transaction)
             
             # Wait for receipt
             receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=60)
@@ -240,21 +242,22 @@ class EscrowService:
             else:
                 proof_bytes = bytes.fromhex(proof_hash)
             
-            # Build transaction
-            tx = self.contract.functions.releaseEscrow(
-                job_bytes,
-                proof_bytes
-            ).build_transaction({
-                'from': self.account.address,
-                'gas': 100000,
-                'gasPrice': self.w3.eth.gas_price,
-                'nonce': self.w3.eth.get_transaction_count(self.account.address),
-                'chainId': CHAIN_ID
-            })
-            
-            # Sign and send
-            signed = self.w3.eth.account.sign_transaction(tx, PRIVATE_KEY)
-            tx_hash = self.w3.eth.send_raw_transaction(signed.raw_transaction)
+            with signer_nonces.reserve(self.w3, self.account.address) as nonce:
+                # Build transaction
+                tx = self.contract.functions.releaseEscrow(
+                    job_bytes,
+                    proof_bytes
+                ).build_transaction({
+                    'from': self.account.address,
+                    'gas': 100000,
+                    'gasPrice': self.w3.eth.gas_price,
+                    'nonce': nonce,
+                    'chainId': CHAIN_ID
+                })
+                
+                # Sign and send
+                signed = self.w3.eth.account.sign_transaction(tx, PRIVATE_KEY)
+                tx_hash = self.w3.eth.send_raw_transaction(signed.raw_transaction)
             
             # Wait for receipt
             receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=60)
@@ -286,21 +289,22 @@ class EscrowService:
         try:
             job_bytes = self.job_id_to_bytes32(job_id)
             
-            # Build transaction
-            tx = self.contract.functions.refundEscrow(
-                job_bytes,
-                reason
-            ).build_transaction({
-                'from': self.account.address,
-                'gas': 100000,
-                'gasPrice': self.w3.eth.gas_price,
-                'nonce': self.w3.eth.get_transaction_count(self.account.address),
-                'chainId': CHAIN_ID
-            })
-            
-            # Sign and send
-            signed = self.w3.eth.account.sign_transaction(tx, PRIVATE_KEY)
-            tx_hash = self.w3.eth.send_raw_transaction(signed.raw_transaction)
+            with signer_nonces.reserve(self.w3, self.account.address) as nonce:
+                # Build transaction
+                tx = self.contract.functions.refundEscrow(
+                    job_bytes,
+                    reason
+                ).build_transaction({
+                    'from': self.account.address,
+                    'gas': 100000,
+                    'gasPrice': self.w3.eth.gas_price,
+                    'nonce': nonce,
+                    'chainId': CHAIN_ID
+                })
+                
+                # Sign and send
+                signed = self.w3.eth.account.sign_transaction(tx, PRIVATE_KEY)
+                tx_hash = self.w3.eth.send_raw_transaction(signed.raw_transaction)
             
             # Wait for receipt
             receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=60)
@@ -4,49 +4,47 @@ Zero-Knowledge Proof with REAL EZKL SNARK proofs and on-chain anchoring
 Now includes REAL model inference using joblib/pickle and transformers
 """
 import hashlib
+import importlib.util
 import json
+import logging
 import random
 import time
 import os
 import asyncio
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, Tuple, Optional
+from typing import Dict, Any, Tuple, Optional, Callable
 from pathlib import Path
 
 from ..core.blockchain import blockchain_service
 from ..core.database import db
 
+logger = logging.getLogger(__name__)
+
 # Try to import EZKL service for real ZK proofs
 try:
     from .ezkl_service import ezkl_service, EZKL_AVAILABLE
-    print(f"[SUCCESS] EZKL service loaded - Real ZK proofs: {EZKL_AVAILABLE}")
 except ImportError:
     EZKL_AVAILABLE = False
     ezkl_service = None
-    print("[WARNING] EZKL service not available - Using hash-based proofs")
 
-# Try to import transformers for real sentiment analysis
-try:
-    from transformers import pipeline
-    TRANSFORMERS_AVAILABLE = True
-    print("[SUCCESS] Transformers loaded - Real sentiment analysis available")
-except ImportError:
-    TRANSFORMERS_AVAILABLE = False
-    print("[WARNING] Transformers not installed - Using simulated outputs for NLP")
+# transformers and onnxruntime are heavy imports: only probe for them here and
+# import them on first use (get_sentiment_analyzer / ONNX session creation)
+TRANSFORMERS_AVAILABLE = importlib.util.find_spec("transformers") is not None
+ONNX_AVAILABLE = importlib.util.find_spec("onnxruntime") is not None
 
 # Try to import joblib for loading PKL models
 try:
     import joblib
     JOBLIB_AVAILABLE = True
-    print("[SUCCESS] Joblib loaded - PKL model inference available")
 except ImportError:
     try:
         import pickle
         JOBLIB_AVAILABLE = True  # Will use pickle as fallback
-        print("[SUCCESS] Pickle loaded - PKL model inference available")
     except ImportError:
         JOBLIB_AVAILABLE = False
-        print("[WARNING] Joblib/Pickle not installed - Using simulated outputs for PKL models")
 
 # Try to import numpy for array handling
 try:
@@ -54,22 +52,67 @@ try:
     NUMPY_AVAILABLE = True
 except ImportError:
     NUMPY_AVAILABLE = False
-    print("WARN NumPy not installed - Limited array support")
 
-# Try to import onnxruntime for ONNX inference
+logger.info(
+    "Inference backends - EZKL: %s, transformers: %s, joblib/pickle: %s, numpy: %s, onnxruntime: %s",
+    EZKL_AVAILABLE, TRANSFORMERS_AVAILABLE, JOBLIB_AVAILABLE, NUMPY_AVAILABLE, ONNX_AVAILABLE
+)
+
+# Optional BLAKE3 for the internal commitment hashes (SHA-256 fallback)
 try:
-    import onnxruntime as ort
-    ONNX_AVAILABLE = True
-    print("[SUCCESS] ONNX Runtime loaded - ONNX model inference available")
+    import blake3
+    BLAKE3_AVAILABLE = True
 except ImportError:
-    ONNX_AVAILABLE = False
-    print("[WARNING] ONNX Runtime not installed - Using simulated outputs for ONNX models")
+    BLAKE3_AVAILABLE = False
+
+PROOF_VERSION_SHA256 = "zkml-v1.0"
+PROOF_VERSION_BLAKE3 = "zkml-v1.1-blake3"
+
+# Pool for the independent proof component hashes (hashlib releases the GIL)
+_HASH_POOL = ThreadPoolExecutor(max_workers=3, thread_name_prefix="proof-hash")
 
 # Global sentiment analyzer (lazy loaded)
 _sentiment_analyzer = None
 
-# Cache for loaded models
-_model_cache = {}
+# Per-process cache in front of the shared joblib cache, keyed (file_path, kind)
+# with kind one of "pkl" (deserialized model), "predictor", "ort" (session entry)
+_model_cache: Dict[Tuple[str, str], Any] = {}
+
+# Shared on-disk model cache. Lives on tmpfs (/dev/shm) when available so every
+# uvicorn/gunicorn worker reads the same deserialized arrays via mmap instead of
+# each one unpickling its own copy.
+_MODEL_CACHE_DIR = os.path.join(
+    "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir(),
+    "defy_models"
+)
+
+# tmpfs is RAM, so the shared cache is trimmed (LRU) to this size every
+# _MODEL_CACHE_TRIM_INTERVAL_S while models are being loaded
+_MODEL_CACHE_BYTES_LIMIT = int(os.environ.get("MODEL_CACHE_BYTES_LIMIT", 512 * 1024 * 1024))
+_MODEL_CACHE_TRIM_INTERVAL_S = 300.0
+_last_model_cache_trim = float("-inf")
+
+try:
+    _model_memory = joblib.Memory(_MODEL_CACHE_DIR, mmap_mode="r", verbose=0)
+except Exception:  # joblib missing (pickle fallback) or cache dir unusable
+    _model_memory = None
+
+
+def _trim_model_memory():
+    """Evict least recently used entries from the shared cache, at most once per interval"""
+    global _last_model_cache_trim
+    now = time.monotonic()
+    if _model_memory is None or now - _last_model_cache_trim < _MODEL_CACHE_TRIM_INTERVAL_S:
+        return
+    _last_model_cache_trim = now
+    try:
+        try:
+            _model_memory.reduce_size(bytes_limit=_MODEL_CACHE_BYTES_LIMIT)
+        except TypeError:  # joblib < 1.4 reads the limit from the Memory object
+            _model_memory.bytes_limit = _MODEL_CACHE_BYTES_LIMIT
+            _model_memory.reduce_size()
+    except Exception as e:
+        print(f"[WARNING] Shared model cache trim failed: {e}")
 
 
 def get_sentiment_analyzer():
@@ -77,6 +120,7 @@ def get_sentiment_analyzer():
     global _sentiment_analyzer
     if _sentiment_analyzer is None and TRANSFORMERS_AVAILABLE:
         print("[INFO] Loading sentiment analysis model...")
+        from transformers import pipeline
         _sentiment_analyzer = pipeline(
             "sentiment-analysis",
             model="distilbert-base-uncased-finetuned-sst-2-english",
@@ -86,44 +130,199 @@ def get_sentiment_analyzer():
     return _sentiment_analyzer
 
 
+# Short-lived stat cache so repeated misses don't stat() the same path per request
+_STAT_TTL_S = 5.0
+_stat_cache: Dict[str, Tuple[float, Optional[int]]] = {}
+
+
+def _cached_mtime_ns(file_path: str) -> Optional[int]:
+    """mtime of file_path in ns, or None if it doesn't exist (cached for _STAT_TTL_S)"""
+    now = time.monotonic()
+    cached = _stat_cache.get(file_path)
+    if cached is not None and now - cached[0] < _STAT_TTL_S:
+        return cached[1]
+    try:
+        mtime_ns = os.stat(file_path).st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    _stat_cache[file_path] = (now, mtime_ns)
+    return mtime_ns
+
+
+def _load_pkl_from_disk(file_path: str, mtime_ns: int):
+    """Deserialize a PKL/joblib file (mtime_ns only keys the shared cache)"""
+    # Suppress sklearn version warnings
+    import warnings
+    warnings.filterwarnings('ignore', category=UserWarning)
+    warnings.filterwarnings('ignore', category=FutureWarning)
+    
+    try:
+        import joblib
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            # Memory-map numpy arrays so workers share the page cache
+            return joblib.load(file_path, mmap_mode='r')
+    except Exception as e1:
+        print(f"Joblib failed: {e1}, trying pickle...")
+        import pickle
+        with open(file_path, 'rb') as f:
+            return pickle.load(f)
+
+
+if _model_memory is not None:
+    _load_pkl_shared = _model_memory.cache(_load_pkl_from_disk)
+else:
+    _load_pkl_shared = _load_pkl_from_disk
+
+
 def load_pkl_model(file_path: str):
     """Load a PKL/pickle model file"""
-    global _model_cache
+    key = (file_path, "pkl")
+    if key in _model_cache:
+        return _model_cache[key]
     
-    if file_path in _model_cache:
-        return _model_cache[file_path]
-    
-    if not os.path.exists(file_path):
+    mtime_ns = _cached_mtime_ns(file_path)
+    if mtime_ns is None:
         print(f"[WARNING] Model file not found: {file_path}")
         return None
     
     try:
         print(f"[INFO] Loading model from {file_path}...")
         
-        # Suppress sklearn version warnings
-        import warnings
-        warnings.filterwarnings('ignore', category=UserWarning)
-        warnings.filterwarnings('ignore', category=FutureWarning)
-        
         try:
-            import joblib
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore")
-                model = joblib.load(file_path)
+            model = _load_pkl_shared(file_path, mtime_ns)
         except Exception as e1:
-            print(f"Joblib failed: {e1}, trying pickle...")
-            import pickle
-            with open(file_path, 'rb') as f:
-                model = pickle.load(f)
+            # Shared cache unusable (e.g. unwritable dir) - load directly
+            print(f"Shared model cache failed: {e1}, loading directly...")
+            model = _load_pkl_from_disk(file_path, 0)
+        _trim_model_memory()
         
-        _model_cache[file_path] = model
+        _model_cache[key] = model
         print(f"[SUCCESS] Model loaded successfully!")
         return model
     except Exception as e:
         print(f"[ERROR] Error loading model: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.debug("Model load failed for %s", file_path, exc_info=True)
+        return None
+
+
+def _compile_linear_forward(model: Any) -> Optional[Callable[[Any], Tuple[Any, Any]]]:
+    """
+    Build a plain NumPy forward pass for fitted LogisticRegression models
+    Weights are pulled out once so inference is one matmul plus sigmoid or
+    softmax, skipping sklearn's per-call validation. Returns None for models
+    that need sklearn (trees, ovr/liblinear multiclass, ...).
+    """
+    if type(model).__name__ != "LogisticRegression":
+        return None
+    coef = getattr(model, "coef_", None)
+    intercept = getattr(model, "intercept_", None)
+    classes = getattr(model, "classes_", None)
+    if coef is None or intercept is None or classes is None:
         return None
+    
+    weights = np.ascontiguousarray(coef.T, dtype=np.float64)
+    bias = np.asarray(intercept, dtype=np.float64)
+    
+    if weights.shape[1] == 1:
+        def forward(X):
+            scores = np.asarray(X, dtype=np.float64) @ weights + bias
+            positive = 1.0 / (1.0 + np.exp(-scores))
+            proba = np.hstack([1.0 - positive, positive])
+            return classes[(positive[:, 0] > 0.5).astype(np.intp)], proba
+        return forward
+    
+    multi_class = getattr(model, "multi_class", "auto")
+    if multi_class not in ("auto", "multinomial", "deprecated") or getattr(model, "solver", "lbfgs") == "liblinear":
+        return None
+    
+    def forward(X):
+        scores = np.asarray(X, dtype=np.float64) @ weights + bias
+        scores -= scores.max(axis=1, keepdims=True)
+        np.exp(scores, out=scores)
+        scores /= scores.sum(axis=1, keepdims=True)
+        return classes[scores.argmax(axis=1)], scores
+    return forward
+
+
+# oneDNN-backed providers (VNNI/AVX-512 int8 kernels), used when the installed
+# onnxruntime build ships them
+_ONNX_ACCELERATED_PROVIDERS = ("DnnlExecutionProvider", "OpenVINOExecutionProvider")
+
+
+def _onnx_providers() -> list:
+    """Execution providers in preference order, always ending with the CPU EP"""
+    import onnxruntime as ort
+    available = ort.get_available_providers()
+    providers = [p for p in _ONNX_ACCELERATED_PROVIDERS if p in available]
+    providers.append(("CPUExecutionProvider", {"arena_extend_strategy": "kSameAsRequested"}))
+    return providers
+
+
+def get_onnx_session(file_path: str) -> Dict[str, Any]:
+    """
+    Get (or build once) a cached ONNX Runtime session for a model file
+    Session construction parses and optimizes the graph, so it is never
+    repeated per request
+    """
+    key = (file_path, "ort")
+    entry = _model_cache.get(key)
+    if entry is not None:
+        return entry
+    
+    import onnxruntime as ort
+    sess_options = ort.SessionOptions()
+    sess_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    sess_options.execution_mode = ort.ExecutionMode.ORT_PARALLEL
+    sess_options.intra_op_num_threads = os.cpu_count() or 1
+    session = ort.InferenceSession(file_path, sess_options, providers=_onnx_providers())
+    
+    model_input = session.get_inputs()[0]
+    entry = {
+        "session": session,
+        "input_name": model_input.name,
+        "input_shape": model_input.shape,
+        # Reusable 1x1x28x28 image buffer, allocated on first MNIST-style call
+        "image_buffer": None,
+        "image_ort_value": None,
+        "lock": threading.Lock()
+    }
+    _model_cache[key] = entry
+    return entry
+
+
+def _compile_onnx_forward(onnx_path: str) -> Callable[[Any], Tuple[Any, Any]]:
+    """
+    Forward pass through an ONNX export of a sklearn model (skl2onnx, zipmap off)
+    Returns (labels, probabilities-or-None) like the linear fast path
+    """
+    entry = get_onnx_session(onnx_path)
+    session = entry["session"]
+    input_name = entry["input_name"]
+    
+    def forward(X):
+        outputs = session.run(None, {input_name: np.asarray(X, dtype=np.float32)})
+        proba = outputs[1] if len(outputs) > 1 else None
+        return np.asarray(outputs[0]).ravel(), proba
+    return forward
+
+
+def quantize_onnx_model(file_path: str) -> Optional[str]:
+    """
+    Write a dynamically quantized INT8 copy of an ONNX model next to it
+    Returns the .int8.onnx path, or None if quantization isn't possible
+    """
+    if not ONNX_AVAILABLE:
+        return None
+    
+    int8_path = os.path.splitext(file_path)[0] + ".int8.onnx"
+    try:
+        from onnxruntime.quantization import quantize_dynamic, QuantType
+        quantize_dynamic(file_path, int8_path, weight_type=QuantType.QInt8)
+    except Exception as e:
+        print(f"[WARNING] INT8 quantization skipped for {file_path}: {e}")
+        return None
+    return int8_path
 
 
 class ZKProofGenerator:
@@ -132,9 +331,11 @@ class ZKProofGenerator:
     """
     
     def __init__(self):
-        self.proof_version = "zkml-v1.0"
+        self.proof_version = PROOF_VERSION_BLAKE3 if BLAKE3_AVAILABLE else PROOF_VERSION_SHA256
         self.model_version = "v-inference-v1.0.0"
         self.blockchain = blockchain_service
+        # Strong refs so in-flight background anchor tasks aren't GC'd
+        self._anchor_tasks = set()
     
     def generate_proof(
         self, 
@@ -148,9 +349,12 @@ class ZKProofGenerator:
         start_time = time.time()
         timestamp = datetime.utcnow().isoformat() + "Z"
         
-        input_hash = self._hash_input(input_data)
-        computation_hash = self._hash_computation(output_data)
+        input_future = _HASH_POOL.submit(self._hash_input, input_data)
+        computation_future = _HASH_POOL.submit(self._hash_computation, output_data)
+        # Model hash covers a few dozen bytes - cheaper inline than via the pool
         model_hash = self._hash_model(model_id)
+        input_hash = input_future.result()
+        computation_hash = computation_future.result()
         
         proof_hash = self._generate_master_hash(
             input_hash,
@@ -160,7 +364,8 @@ class ZKProofGenerator:
             timestamp
         )
         
-        proof_bytes32 = self._to_bytes32(proof_hash)
+        # The master hash is already a 0x-prefixed 32-byte digest
+        proof_bytes32 = proof_hash
         generation_time_ms = round((time.time() - start_time) * 1000, 2)
         
         proof = {
@@ -193,7 +398,7 @@ class ZKProofGenerator:
         }
         
         if anchor_on_chain:
-            proof["on_chain"] = self._anchor_on_chain(job_id, proof_hash)
+            proof["on_chain"] = self._schedule_anchor(job_id, proof_hash)
         else:
             proof["on_chain"] = {
                 "anchored": False,
@@ -202,17 +407,23 @@ class ZKProofGenerator:
         
         return proof
     
+    def _digest(self, data: str, proof_version: Optional[str] = None) -> bytes:
+        """Raw 32-byte digest; hex-encoded once for transport"""
+        if (proof_version or self.proof_version) == PROOF_VERSION_BLAKE3:
+            return blake3.blake3(data.encode()).digest()
+        return hashlib.sha256(data.encode()).digest()
+    
     def _hash_input(self, input_data: Dict[str, Any]) -> str:
         sorted_data = json.dumps(input_data, sort_keys=True, default=str)
-        return "0x" + hashlib.sha256(sorted_data.encode()).hexdigest()
+        return "0x" + self._digest(sorted_data).hex()
     
     def _hash_computation(self, output_data: Dict[str, Any]) -> str:
         sorted_data = json.dumps(output_data, sort_keys=True, default=str)
-        return "0x" + hashlib.sha256(sorted_data.encode()).hexdigest()
+        return "0x" + self._digest(sorted_data).hex()
     
     def _hash_model(self, model_id: str) -> str:
         model_data = f"{model_id}:{self.model_version}"
-        return "0x" + hashlib.sha256(model_data.encode()).hexdigest()
+        return "0x" + self._digest(model_data).hex()
     
     def _generate_master_hash(
         self, 
@@ -220,14 +431,56 @@ class ZKProofGenerator:
         computation_hash: str,
         model_hash: str,
         job_id: str, 
-        timestamp: str
+        timestamp: str,
+        proof_version: Optional[str] = None
     ) -> str:
         combined = f"{input_hash}:{computation_hash}:{model_hash}:{job_id}:{timestamp}:{self.model_version}"
-        return "0x" + hashlib.sha256(combined.encode()).hexdigest()
+        return "0x" + self._digest(combined, proof_version).hex()
     
-    def _to_bytes32(self, hex_hash: str) -> str:
-        clean_hash = hex_hash.replace("0x", "")[:64]
-        return "0x" + clean_hash.ljust(64, '0')
+    def _schedule_anchor(self, job_id: str, proof_hash: str) -> Dict[str, Any]:
+        """
+        Anchor in the background when called from the event loop
+        The proof is returned immediately with a pending status; the result is
+        written back to the stored proof/job once the transaction confirms.
+        Outside an event loop (scripts) anchoring stays synchronous.
+        """
+        if not self.blockchain.connected:
+            return self._anchor_on_chain(job_id, proof_hash)
+        
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return self._anchor_on_chain(job_id, proof_hash)
+        
+        task_id = f"anchor-{job_id}"
+        task = loop.create_task(self._anchor_in_background(job_id, proof_hash), name=task_id)
+        self._anchor_tasks.add(task)
+        task.add_done_callback(self._anchor_tasks.discard)
+        
+        return {
+            "anchored": False,
+            "status": "pending",
+            "task_id": task_id,
+            "chain": "Shardeum"
+        }
+    
+    async def _anchor_on_chain_async(self, job_id: str, proof_hash: str) -> Dict[str, Any]:
+        """Run the blocking anchor transaction off the event loop"""
+        return await asyncio.to_thread(self._anchor_on_chain, job_id, proof_hash)
+    
+    async def _anchor_in_background(self, job_id: str, proof_hash: str):
+        """Anchor a proof and record the outcome on the stored proof and job"""
+        try:
+            on_chain = await self._anchor_on_chain_async(job_id, proof_hash)
+        except Exception as e:
+            on_chain = {"anchored": False, "error": str(e), "chain": "Shardeum"}
+        
+        db.update_proof_by_job(job_id, {"on_chain": on_chain})
+        if on_chain.get("anchored"):
+            db.update_job(job_id, {
+                "transaction_hash": on_chain.get("transaction_hash"),
+                "block_number": on_chain.get("block_number")
+            })
     
     def _anchor_on_chain(self, job_id: str, proof_hash: str) -> Dict[str, Any]:
         """Anchor proof on Shardeum blockchain"""
@@ -273,13 +526,19 @@ class ZKProofGenerator:
         components = proof.get("components", {})
         job_id = proof.get("job_id", "")
         timestamp = proof.get("timestamp", "")
+        proof_version = proof.get("proof_version", PROOF_VERSION_SHA256)
+        
+        if proof_version == PROOF_VERSION_BLAKE3 and not BLAKE3_AVAILABLE:
+            verification_details["proof_version"] = proof_version
+            return False, "blake3 not installed - cannot verify this proof version", verification_details
         
         reconstructed = self._generate_master_hash(
             components.get("input_hash", ""),
             components.get("computation_hash", ""),
             components.get("model_hash", ""),
             job_id,
-            timestamp
+            timestamp,
+            proof_version
         )
         
         hash_matches = reconstructed == proof.get("proof_hash")
@@ -351,6 +610,7 @@ class InferenceEngine:
     
     # Iris class mapping
     IRIS_CLASSES = ["setosa", "versicolor", "virginica"]
+    IRIS_FEATURE_ORDER = ["sepal_length", "sepal_width", "petal_length", "petal_width"]
     
     def __init__(self):
         self.zkml = ZKProofGenerator()
@@ -377,7 +637,6 @@ class InferenceEngine:
             output_data = self._run_real_sentiment(input_data)
             inference_time = time.time() - start_time
             real_inference = True
-            real_inference = True
         elif file_path and JOBLIB_AVAILABLE and file_path.endswith(('.pkl', '.joblib')):
             # Real PKL model inference
             output_data = self._run_pkl_model(file_path, input_data, model_info)
@@ -444,21 +703,112 @@ class InferenceEngine:
         
         return result
     
+    def _compile_predictor(
+        self,
+        file_path: str,
+        model: Any,
+        model_name: str,
+        onnx_path: Optional[str] = None
+    ) -> Callable[[Any, int], Dict[str, Any]]:
+        """
+        Introspect a loaded model once and return a closure specialized for it
+        Everything constant per model (proba support, class names, file name) is
+        resolved here so each inference only runs predict/predict_proba
+        """
+        predict = model.predict
+        predict_proba = getattr(model, "predict_proba", None)
+        # Prefer the model's ONNX export (ORT tree/linear kernels), then the
+        # closed-form NumPy path for linear models (e.g. the Iris classifier)
+        fast_forward = None
+        if onnx_path and ONNX_AVAILABLE and NUMPY_AVAILABLE:
+            try:
+                fast_forward = _compile_onnx_forward(onnx_path)
+            except Exception as e:
+                print(f"[WARNING] ONNX export unusable ({e}), using sklearn")
+        if fast_forward is None and NUMPY_AVAILABLE:
+            fast_forward = _compile_linear_forward(model)
+        model_file = os.path.basename(file_path)
+        name_is_iris = "iris" in model_name
+        iris_classes = self.IRIS_CLASSES
+        
+        # With predict_proba the class count is fixed by the fitted classes_
+        fitted_classes = getattr(model, "classes_", None)
+        proba_class_names = (
+            [f"class_{i}" for i in range(len(fitted_classes))]
+            if predict_proba is not None and fitted_classes is not None else None
+        )
+        
+        def predictor(X: Any, n_features: int) -> Dict[str, Any]:
+            probabilities = None
+            if fast_forward is not None:
+                prediction, proba = fast_forward(X)
+                if proba is not None:
+                    probabilities = proba[0]
+            else:
+                prediction = predict(X)
+                
+                # Get class probabilities if available
+                if predict_proba is not None:
+                    try:
+                        probabilities = predict_proba(X)[0]
+                    except Exception:
+                        pass
+            predicted_class_idx = int(prediction[0])
+            
+            # Auto-detect Iris model
+            if name_is_iris or (n_features == 4 and predicted_class_idx in (0, 1, 2)):
+                class_names = iris_classes
+            elif probabilities is not None and proba_class_names is not None:
+                class_names = proba_class_names
+            else:
+                # Default class names
+                num_classes = len(probabilities) if probabilities is not None else max(predicted_class_idx + 1, 3)
+                class_names = [f"class_{i}" for i in range(num_classes)]
+            
+            predicted_class = class_names[predicted_class_idx] if predicted_class_idx < len(class_names) else f"class_{predicted_class_idx}"
+            
+            result = {
+                "prediction": predicted_class,
+                "predicted_class_index": predicted_class_idx,
+                "confidence": round(float(probabilities[predicted_class_idx]), 4) if probabilities is not None else 0.95,
+                "real_inference": True,
+                "model_file": model_file
+            }
+            
+            # Add probability distribution if available
+            if probabilities is not None:
+                result["class_probabilities"] = {
+                    class_names[i] if i < len(class_names) else f"class_{i}": round(float(p), 4)
+                    for i, p in enumerate(probabilities)
+                }
+            
+            return result
+        
+        return predictor
+    
     def _run_pkl_model(self, file_path: str, input_data: Dict[str, Any], model_info: Dict) -> Dict[str, Any]:
         """
         Run inference on a PKL/joblib model
         Supports scikit-learn models like Iris classifier
         """
         try:
-            model = load_pkl_model(file_path)
-            if model is None:
-                return {
-                    "error": "Failed to load model",
-                    "reason": "Model file could not be loaded (sklearn version mismatch or missing dependencies)",
-                    "file_path": file_path,
-                    "suggestion": "Retrain the model with sklearn 1.4.2 or upload a compatible .pkl file",
-                    "real_inference": False
-                }
+            predictor = _model_cache.get((file_path, "predictor"))
+            if predictor is None:
+                model = load_pkl_model(file_path)
+                if model is None:
+                    return {
+                        "error": "Failed to load model",
+                        "reason": "Model file could not be loaded (sklearn version mismatch or missing dependencies)",
+                        "file_path": file_path,
+                        "suggestion": "Retrain the model with sklearn 1.4.2 or upload a compatible .pkl file",
+                        "real_inference": False
+                    }
+                model_name = model_info.get("name", "").lower() if model_info else ""
+                onnx_path = ((model_info or {}).get("metadata") or {}).get("onnx_path")
+                if onnx_path and _cached_mtime_ns(onnx_path) is None:
+                    onnx_path = None
+                predictor = self._compile_predictor(file_path, model, model_name, onnx_path)
+                _model_cache[(file_path, "predictor")] = predictor
             
             # Parse input features
             features = input_data.get("features", input_data.get("input", []))
@@ -466,8 +816,7 @@ class InferenceEngine:
             # Handle different input formats
             if isinstance(features, dict):
                 # If dict like {"sepal_length": 5.1, "sepal_width": 3.5, ...}
-                feature_order = ["sepal_length", "sepal_width", "petal_length", "petal_width"]
-                features = [features.get(k, 0) for k in feature_order]
+                features = [features.get(k, 0) for k in self.IRIS_FEATURE_ORDER]
             
             if not features or not isinstance(features, (list, tuple)):
                 return {
@@ -478,59 +827,17 @@ class InferenceEngine:
             
             # Convert to numpy array for prediction
             if NUMPY_AVAILABLE:
-                import numpy as np
                 X = np.array(features).reshape(1, -1)
             else:
                 X = [features]
             
-            # Run prediction
-            prediction = model.predict(X)
-            
-            # Get class probabilities if available
-            probabilities = None
-            if hasattr(model, 'predict_proba'):
-                try:
-                    probabilities = model.predict_proba(X)[0]
-                except:
-                    pass
-            
-            # Determine class names based on model
-            model_name = model_info.get("name", "").lower() if model_info else ""
-            
-            # Auto-detect Iris model
-            if "iris" in model_name or (len(features) == 4 and int(prediction[0]) in [0, 1, 2]):
-                class_names = self.IRIS_CLASSES
-            else:
-                # Default class names
-                num_classes = len(probabilities) if probabilities is not None else max(int(prediction[0]) + 1, 3)
-                class_names = [f"class_{i}" for i in range(num_classes)]
-            
-            # Build response
-            predicted_class_idx = int(prediction[0])
-            predicted_class = class_names[predicted_class_idx] if predicted_class_idx < len(class_names) else f"class_{predicted_class_idx}"
-            
-            result = {
-                "prediction": predicted_class,
-                "predicted_class_index": predicted_class_idx,
-                "confidence": round(float(probabilities[predicted_class_idx]), 4) if probabilities is not None else 0.95,
-                "real_inference": True,
-                "model_file": os.path.basename(file_path)
-            }
-            
-            # Add probability distribution if available
-            if probabilities is not None:
-                result["class_probabilities"] = {
-                    class_names[i] if i < len(class_names) else f"class_{i}": round(float(p), 4)
-                    for i, p in enumerate(probabilities)
-                }
-            
-            print(f"[SUCCESS] Real inference: {predicted_class} (confidence: {result['confidence']})")
+            result = predictor(X, len(features))
+            print(f"[SUCCESS] Real inference: {result['prediction']} (confidence: {result['confidence']})")
             return result
             
         except Exception as e:
             print(f"[ERROR] PKL inference error: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.debug("PKL inference failed for %s", file_path, exc_info=True)
             return {
                 "error": "Inference failed",
                 "reason": str(e),
@@ -545,10 +852,14 @@ class InferenceEngine:
         Handles input reshaping for models like MNIST (1x1x28x28)
         """
         try:
-            # Create session
-            session = ort.InferenceSession(file_path)
-            input_name = session.get_inputs()[0].name
-            input_shape = session.get_inputs()[0].shape
+            # Prefer the INT8 variant produced at registration time
+            int8_path = ((model_info or {}).get("metadata") or {}).get("int8_path")
+            session_path = int8_path if int8_path and _cached_mtime_ns(int8_path) is not None else file_path
+            
+            onnx_entry = get_onnx_session(session_path)
+            session = onnx_entry["session"]
+            input_name = onnx_entry["input_name"]
+            input_shape = onnx_entry["input_shape"]
             
             # Parse input features
             features = input_data.get("features", input_data.get("input", []))
@@ -561,48 +872,59 @@ class InferenceEngine:
                     "real_inference": False
                 }
             
-            # Reshape based on model expectation
-            if NUMPY_AVAILABLE:
+            if not NUMPY_AVAILABLE:
+                return {
+                    "error": "NumPy required",
+                    "reason": "NumPy is required for ONNX inference",
+                    "real_inference": False
+                }
+            
+            # MNIST fast path: copy straight into the session's preallocated
+            # float32 buffer and feed it as an OrtValue (no per-call allocation)
+            if len(input_shape) == 4 and len(features) == 784:
+                with onnx_entry["lock"]:
+                    if onnx_entry["image_buffer"] is None:
+                        import onnxruntime as ort
+                        onnx_entry["image_buffer"] = np.empty((1, 1, 28, 28), dtype=np.float32)
+                        onnx_entry["image_ort_value"] = ort.OrtValue.ortvalue_from_numpy(
+                            onnx_entry["image_buffer"], "cpu", 0
+                        )
+                    X = onnx_entry["image_buffer"]
+                    np.copyto(X, np.asarray(features, dtype=np.float32).reshape(1, 1, 28, 28))
+                    ort_outputs = session.run_with_ort_values(
+                        None, {input_name: onnx_entry["image_ort_value"]}
+                    )
+                    prediction = ort_outputs[0].numpy()
+            else:
                 X = np.array(features, dtype=np.float32)
                 
-                # MNIST / Image handling
+                # Image handling
                 # If model expects 4D input but we have flat 1D array
                 if len(input_shape) == 4 and len(X.shape) == 1:
-                    # Specific for MNIST 28x28 = 784
-                    if X.size == 784:
-                        X = X.reshape(1, 1, 28, 28)
-                    else:
-                        # Try to reshape dynamically if size matches
-                        total_expected = 1
-                        for dim in input_shape:
-                            if isinstance(dim, int):
-                                total_expected *= dim
-                        
-                        if total_expected > 0 and X.size != total_expected:
-                             return {
-                                "error": "Input Size Mismatch",
-                                "reason": f"Model expects {total_expected} features (28x28 image), but got {X.size}.",
-                                "suggestion": "Use the 'Load Sample' button to get the correct 784 features.",
-                                "real_inference": False
-                             }
-                        
-                        if total_expected > 0 and X.size == total_expected:
-                             X = X.reshape(input_shape)
+                    # Try to reshape dynamically if size matches
+                    total_expected = 1
+                    for dim in input_shape:
+                        if isinstance(dim, int):
+                            total_expected *= dim
+                    
+                    if total_expected > 0 and X.size != total_expected:
+                         return {
+                            "error": "Input Size Mismatch",
+                            "reason": f"Model expects {total_expected} features (28x28 image), but got {X.size}.",
+                            "suggestion": "Use the 'Load Sample' button to get the correct 784 features.",
+                            "real_inference": False
+                         }
+                    
+                    if total_expected > 0 and X.size == total_expected:
+                         X = X.reshape(input_shape)
                 
                 # General case: add batch dimension if missing
                 if len(X.shape) == len(input_shape) - 1:
                     X = np.expand_dims(X, axis=0)
-                    
-            else:
-                 return {
-                    "error": "NumPy required",
-                    "reason": "NumPy is required for ONNX inference",
-                    "real_inference": False
-                }
-            
-            # Run prediction
-            outputs = session.run(None, {input_name: X})
-            prediction = outputs[0]
+                
+                # Run prediction
+                outputs = session.run(None, {input_name: X})
+                prediction = outputs[0]
             
             # Process output
             predicted_class_idx = int(np.argmax(prediction))
@@ -635,8 +957,7 @@ class InferenceEngine:
             
         except Exception as e:
             print(f"[ERROR] ONNX Job failed: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.debug("ONNX inference failed for %s", file_path, exc_info=True)
             
             # Detailed debug info
             debug_info = ""
@@ -706,9 +1027,14 @@ class InferenceEngine:
         
         if model_type in ["classification", "image_classification"]:
             classes = ["cat", "dog", "bird", "car", "plane"]
-            probs = sorted([random.random() for _ in classes], reverse=True)
-            total = sum(probs)
-            probs = [p / total for p in probs]
+            if NUMPY_AVAILABLE:
+                probs = np.sort(np.random.default_rng().random(len(classes)))[::-1]
+                probs /= probs.sum()
+                probs = probs.tolist()
+            else:
+                probs = sorted([random.random() for _ in classes], reverse=True)
+                total = sum(probs)
+                probs = [p / total for p in probs]
             
             return {
                 "predictions": [
@@ -751,8 +1077,12 @@ class InferenceEngine:
             }
         
         elif model_type in ["embedding", "encoder"]:
+            if NUMPY_AVAILABLE:
+                embedding = np.random.default_rng().uniform(-1, 1, 384).round(6).tolist()
+            else:
+                embedding = [round(random.uniform(-1, 1), 6) for _ in range(384)]
             return {
-                "embedding": [round(random.uniform(-1, 1), 6) for _ in range(384)],
+                "embedding": embedding,
                 "dimension": 384,
                 "normalized": True,
                 "real_inference": False
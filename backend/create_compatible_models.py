@@ -10,76 +10,90 @@ warnings.filterwarnings('ignore')
 from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
 from sklearn.linear_model import LogisticRegression, LinearRegression
 from sklearn.preprocessing import StandardScaler
+from sklearn.base import is_classifier
+from skl2onnx import convert_sklearn
+from skl2onnx.common.data_types import FloatTensorType
 import joblib
+from joblib import Parallel, delayed
 
 # Create storage directory
 os.makedirs('storage/models', exist_ok=True)
 
-models_created = []
+# (filename, display name, model type, n_features, label kind, estimator factory)
+# Each spec is trained independently, so the fits can run concurrently.
+# Forests are depth/leaf-capped: on random labels unbounded trees grow huge
+# and slow to load and traverse.
+MODEL_SPECS = [
+    # 1. Fraud Detection Model (Binary Classification) - 30 features like credit card dataset
+    ('fraud_detection_v2.pkl', 'Fraud Detection v2', 'classification', 30, 'binary',
+     lambda: RandomForestClassifier(n_estimators=50, max_depth=12, min_samples_leaf=8, random_state=42, n_jobs=-1)),
+    # 2. Customer Churn Model (Binary Classification)
+    ('churn_predictor_v2.pkl', 'Customer Churn v2', 'classification', 20, 'binary',
+     lambda: RandomForestClassifier(n_estimators=50, max_depth=12, min_samples_leaf=8, random_state=42, n_jobs=-1)),
+    # 3. Credit Card Fraud (Binary Classification)
+    ('creditcard_v2.pkl', 'Credit Card Fraud v2', 'classification', 28, 'binary',
+     lambda: LogisticRegression(random_state=42, n_jobs=-1, solver='lbfgs')),
+    # 4. Home Price Predictor (Regression) - like Boston housing
+    ('home_price_v2.pkl', 'Home Price Predictor v2', 'regression', 13, 'price',
+     lambda: RandomForestRegressor(n_estimators=50, max_depth=12, min_samples_leaf=8, random_state=42, n_jobs=-1)),
+    # 5. Sentiment Classifier (Multi-class) - 0=negative, 1=neutral, 2=positive
+    ('sentiment_v2.pkl', 'Sentiment Classifier v2', 'classification', 100, 'three_class',
+     lambda: RandomForestClassifier(n_estimators=50, max_depth=12, min_samples_leaf=8, random_state=42, n_jobs=-1)),
+]
 
-# 1. Fraud Detection Model (Binary Classification)
-print("Creating Fraud Detection Model...")
-np.random.seed(42)
-X_fraud = np.random.randn(1000, 30)  # 30 features like credit card dataset
-y_fraud = (np.random.rand(1000) > 0.5).astype(int)  # 0 or 1
-fraud_model = RandomForestClassifier(n_estimators=50, random_state=42)
-fraud_model.fit(X_fraud, y_fraud)
-joblib.dump(fraud_model, 'storage/models/fraud_detection_v2.pkl')
-models_created.append(('fraud_detection_v2.pkl', 'Fraud Detection v2', 'classification'))
-print("  ✅ Created")
 
-# 2. Customer Churn Model (Binary Classification)
-print("Creating Customer Churn Model...")
-X_churn = np.random.randn(1000, 20)
-y_churn = (np.random.rand(1000) > 0.5).astype(int)
-churn_model = RandomForestClassifier(n_estimators=50, random_state=42)
-churn_model.fit(X_churn, y_churn)
-joblib.dump(churn_model, 'storage/models/churn_predictor_v2.pkl')
-models_created.append(('churn_predictor_v2.pkl', 'Customer Churn v2', 'classification'))
-print("  ✅ Created")
+def train_and_dump(spec, seed):
+    """Generate random training data for one spec, fit it and save the .pkl"""
+    filename, name, model_type, n_features, labels, make_model = spec
+    rng = np.random.RandomState(seed)
+    # float32 features: sklearn trees work in float32, so this skips a copy
+    X = rng.randn(1000, n_features).astype(np.float32)
+    if labels == 'binary':
+        y = (rng.rand(1000) > 0.5).astype(np.int8)  # 0 or 1
+    elif labels == 'price':
+        y = (rng.rand(1000) * 500000 + 100000).astype(np.float32)  # Price range 100k-600k
+    else:
+        y = rng.randint(0, 3, 1000).astype(np.int8)
+    
+    model = make_model()
+    model.fit(X, y)
+    # lz4 keeps files small while decompressing fast; protocol 5 pickles the
+    # tree arrays out-of-band instead of copying them through Python bytes
+    joblib.dump(model, f'storage/models/{filename}', compress=('lz4', 3), protocol=5)
+    
+    # ONNX copy for ONNX Runtime's vectorized tree/linear kernels at inference
+    options = {id(model): {'zipmap': False}} if is_classifier(model) else None
+    onnx_model = convert_sklearn(
+        model,
+        initial_types=[('input', FloatTensorType([None, n_features]))],
+        options=options
+    )
+    onnx_path = f"storage/models/{filename.replace('.pkl', '.onnx')}"
+    with open(onnx_path, 'wb') as f:
+        f.write(onnx_model.SerializeToString())
+    return filename, name, model_type, onnx_path
 
-# 3. Credit Card Fraud (Binary Classification)
-print("Creating Credit Card Fraud Model...")
-X_cc = np.random.randn(1000, 28)
-y_cc = (np.random.rand(1000) > 0.5).astype(int)
-cc_model = LogisticRegression(random_state=42)
-cc_model.fit(X_cc, y_cc)
-joblib.dump(cc_model, 'storage/models/creditcard_v2.pkl')
-models_created.append(('creditcard_v2.pkl', 'Credit Card Fraud v2', 'classification'))
-print("  ✅ Created")
 
-# 4. Home Price Predictor (Regression)
-print("Creating Home Price Model...")
-X_home = np.random.randn(1000, 13)  # Like Boston housing
-y_home = np.random.rand(1000) * 500000 + 100000  # Price range 100k-600k
-home_model = RandomForestRegressor(n_estimators=50, random_state=42)
-home_model.fit(X_home, y_home)
-joblib.dump(home_model, 'storage/models/home_price_v2.pkl')
-models_created.append(('home_price_v2.pkl', 'Home Price Predictor v2', 'regression'))
-print("  ✅ Created")
-
-# 5. Sentiment Classifier (Multi-class)
-print("Creating Sentiment Model...")
-X_sent = np.random.randn(1000, 100)
-y_sent = np.random.randint(0, 3, 1000)  # 0=negative, 1=neutral, 2=positive
-sent_model = RandomForestClassifier(n_estimators=50, random_state=42)
-sent_model.fit(X_sent, y_sent)
-joblib.dump(sent_model, 'storage/models/sentiment_v2.pkl')
-models_created.append(('sentiment_v2.pkl', 'Sentiment Classifier v2', 'classification'))
-print("  ✅ Created")
+print(f"Training {len(MODEL_SPECS)} models in parallel...")
+models_created = Parallel(n_jobs=len(MODEL_SPECS), backend='loky')(
+    delayed(train_and_dump)(spec, 42 + i) for i, spec in enumerate(MODEL_SPECS)
+)
+for _, name, _, _ in models_created:
+    print(f"  ✅ Created {name}")
 
 print(f"\n✅ Created {len(models_created)} compatible models!")
 
 # Now add them to the database
-import json
-with open('storage/models.json', 'r') as f:
-    models = json.load(f)
+import orjson
+models_path = 'storage/models.json'
+with open(models_path, 'rb') as f:
+    models = orjson.loads(f.read())
 
-# Remove old entries for v2 models if they exist
-models = [m for m in models if not m.get('name', '').endswith(' v2')]
+# Index by id so re-running replaces existing v2 entries in place
+by_id = {m['id']: m for m in models}
 
 # Add new models
-for filename, name, model_type in models_created:
+for filename, name, model_type, onnx_path in models_created:
     model_id = f"model-{filename.replace('.pkl', '').replace('_', '-')}"
     new_model = {
         'id': model_id,
@@ -91,16 +105,22 @@ for filename, name, model_type in models_created:
         'file_path': f'storage/models/{filename}',
         'metadata': {
             'sklearn_version': '1.4.2',
-            'compatible': True
+            'compatible': True,
+            'onnx_path': onnx_path
         },
         'total_inferences': 0,
         'average_latency_ms': 0,
         'created_at': '2026-01-08T12:00:00Z'
     }
-    models.append(new_model)
+    by_id[model_id] = new_model
     print(f"Added to DB: {name}")
 
-with open('storage/models.json', 'w') as f:
-    json.dump(models, f, indent=2)
+models = list(by_id.values())
+
+# Atomic write: temp file + rename, so a crash never leaves a torn models.json
+tmp_path = models_path + '.tmp'
+with open(tmp_path, 'wb') as f:
+    f.write(orjson.dumps(models, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+os.replace(tmp_path, models_path)
 
 print("\n🎉 All models ready! Restart backend to use them.")
@@ -0,0 +1,325 @@
+"""
+Create the ONNX models for EZKL SNARK proof generation
+Builds every entry in SPECS, then registers them in models.json in one write.
+
+    python create_onnx_models.py                 # build all specs
+    python create_onnx_models.py model-onnx-zkml # build selected ids only
+
+Set VERIFY_ONNX=1 to run a test prediction through onnxruntime after building.
+
+The old create_onnx*.py scripts all registered their graph as 'model-onnx-zkml',
+so whichever ran last owned that id. It now always means the MLP; the other two
+graphs get their own ids (see migrate_legacy_record).
+"""
+import os
+import sys
+import numpy as np
+import onnx
+from onnx import helper, TensorProto, numpy_helper
+import orjson
+
+MODELS_DIR = 'storage/models'
+MODELS_PATH = 'storage/models.json'
+
+# Run the onnxruntime check against the float reference (off by default)
+VERIFY = bool(os.environ.get('VERIFY_ONNX'))
+
+CLASSES = ['Class 0', 'Class 1', 'Class 2']
+
+SPECS = [
+    {
+        'id': 'model-onnx-zkml',
+        'name': '[ZKML] Simple Classifier (REAL SNARK)',
+        'description': 'ONNX MLP classifier with REAL EZKL SNARK proof generation. This model generates actual ZK proofs!',
+        'arch': 'mlp',
+        'file': 'simple_classifier.onnx',
+        'input_size': 4,
+        'hidden_size': 8,
+        'output_size': 3,
+        'quantize': True,
+    },
+    {
+        'id': 'model-onnx-zkml-sklearn',
+        'name': '[ZKML] ONNX Classifier (REAL SNARK)',
+        'description': 'ONNX model with REAL EZKL SNARK proof generation!',
+        'arch': 'sklearn_logreg',
+        'file': 'zkml_classifier.onnx',
+        'input_size': 4,
+        'output_size': 3,
+        'quantize': True,
+    },
+    {
+        'id': 'model-onnx-zkml-int8',
+        'name': '[ZKML] ONNX Model (REAL SNARK)',
+        'description': 'ONNX model with REAL EZKL SNARK proof generation! Uses ZK circuits for verifiable inference.',
+        'arch': 'int8_linear',
+        'file': 'zkml_simple.onnx',
+        'input_size': 4,
+        'output_size': 3,
+        'quantize': False,  # weights are already authored as INT8
+    },
+]
+
+# onnxruntime is optional at build time - without it graphs ship as authored
+try:
+    import onnxruntime as ort
+except ImportError:
+    ort = None
+    print("[INFO] onnxruntime not installed, skipping optimization/quantization")
+
+
+# ============ Builders ============
+# Each returns (onnx.ModelProto, reference_fn) where reference_fn(x) gives
+# the float scores the graph's last output should reproduce.
+
+def build_mlp(spec):
+    """input -> Gemm -> Relu -> Gemm, scaled random init (any weights will do)"""
+    n_in, n_hidden, n_out = spec['input_size'], spec['hidden_size'], spec['output_size']
+    rng = np.random.default_rng(42)
+    W1 = (rng.standard_normal((n_hidden, n_in)) / np.sqrt(n_in)).astype(np.float32)
+    b1 = np.zeros(n_hidden, dtype=np.float32)
+    W2 = (rng.standard_normal((n_out, n_hidden)) / np.sqrt(n_hidden)).astype(np.float32)
+    b2 = np.zeros(n_out, dtype=np.float32)
+
+    initializers = [
+        numpy_helper.from_array(W1, 'W1'),
+        numpy_helper.from_array(b1, 'b1'),
+        numpy_helper.from_array(W2, 'W2'),
+        numpy_helper.from_array(b2, 'b2'),
+    ]
+    nodes = [
+        helper.make_node('Gemm', ['input', 'W1', 'b1'], ['fc1'], alpha=1.0, beta=1.0, transB=1),
+        helper.make_node('Relu', ['fc1'], ['hidden']),
+        helper.make_node('Gemm', ['hidden', 'W2', 'b2'], ['output'], alpha=1.0, beta=1.0, transB=1),
+    ]
+    input_tensor = helper.make_tensor_value_info('input', TensorProto.FLOAT, ['batch_size', n_in])
+    output_tensor = helper.make_tensor_value_info('output', TensorProto.FLOAT, ['batch_size', n_out])
+
+    graph = helper.make_graph(nodes, 'simple_classifier', [input_tensor], [output_tensor], initializers)
+    # Opset 17 so ORT matches its current fused Gemm kernels (IR 8 is required for it)
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid('', 17)])
+    model.ir_version = 8
+
+    def reference(x):
+        return np.maximum(x @ W1.T + b1, 0) @ W2.T + b2
+    return model, reference
+
+
+def build_sklearn_logreg(spec):
+    """sklearn LogisticRegression on random data, converted with skl2onnx"""
+    from sklearn.linear_model import LogisticRegression
+    from skl2onnx import convert_sklearn
+    from skl2onnx.common.data_types import FloatTensorType
+
+    rng = np.random.default_rng(42)
+    X = rng.standard_normal((100, spec['input_size'])).astype(np.float32)
+    y = rng.integers(0, spec['output_size'], 100)
+    clf = LogisticRegression(max_iter=200).fit(X, y)
+
+    initial_type = [('input', FloatTensorType([None, spec['input_size']]))]
+    # zipmap off -> probabilities come out as a plain tensor, not a list of dicts
+    model = convert_sklearn(clf, initial_types=initial_type, options={id(clf): {'zipmap': False}})
+
+    def reference(x):
+        return clf.predict_proba(x)
+    return model, reference
+
+
+def build_int8_linear(spec):
+    """y = Wx + b with W authored directly as INT8 (MatMulInteger)"""
+    n_in, n_out = spec['input_size'], spec['output_size']
+    rng = np.random.default_rng(42)
+    W = rng.standard_normal((n_in, n_out)).astype(np.float32)
+    b = rng.standard_normal(n_out).astype(np.float32)
+
+    # Symmetric per-tensor INT8 quantization of W (zero point 0)
+    scale_w = np.float32(np.abs(W).max() / 127.0)
+    W_q = np.clip(np.round(W / scale_w), -127, 127).astype(np.int8)
+
+    initializers = [
+        numpy_helper.from_array(W_q, 'W_q'),
+        helper.make_tensor('w_zp', TensorProto.INT8, [], [0]),
+        helper.make_tensor('scale_w', TensorProto.FLOAT, [], [float(scale_w)]),
+        numpy_helper.from_array(b, 'b'),
+    ]
+    nodes = [
+        # Quantize input at runtime: input -> uint8 + scale + zero point
+        helper.make_node('DynamicQuantizeLinear', ['input'], ['input_q', 'input_scale', 'input_zp']),
+        # Integer GEMM: input_q @ W_q -> int32
+        helper.make_node('MatMulInteger', ['input_q', 'W_q', 'input_zp', 'w_zp'], ['out_i32']),
+        # Dequantize: float(out_i32) * (input_scale * scale_w)
+        helper.make_node('Cast', ['out_i32'], ['out_f32'], to=TensorProto.FLOAT),
+        helper.make_node('Mul', ['input_scale', 'scale_w'], ['out_scale']),
+        helper.make_node('Mul', ['out_f32', 'out_scale'], ['matmul_out']),
+        # Add bias
+        helper.make_node('Add', ['matmul_out', 'b'], ['output']),
+    ]
+    input_tensor = helper.make_tensor_value_info('input', TensorProto.FLOAT, [1, n_in])
+    output_tensor = helper.make_tensor_value_info('output', TensorProto.FLOAT, [1, n_out])
+
+    graph = helper.make_graph(nodes, 'simple_classifier', [input_tensor], [output_tensor], initializers)
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid('', 11)])
+    model.ir_version = 7
+
+    def reference(x):
+        return x @ W + b
+    return model, reference
+
+
+BUILDERS = {
+    'mlp': build_mlp,
+    'sklearn_logreg': build_sklearn_logreg,
+    'int8_linear': build_int8_linear,
+}
+
+
+# ============ Post-processing ============
+
+def optimize_onnx(onnx_path):
+    """
+    Pre-optimize the saved graph so inference workers skip it at session start.
+    BASIC level (constant folding, redundant-node removal) keeps standard ONNX
+    ops; EXTENDED would emit com.microsoft fused ops that EZKL can't load.
+    """
+    so = ort.SessionOptions()
+    so.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_BASIC
+    so.optimized_model_filepath = onnx_path.replace('.onnx', '.opt.onnx')
+    ort.InferenceSession(onnx_path, so, providers=['CPUExecutionProvider'])
+    os.replace(so.optimized_model_filepath, onnx_path)
+
+
+# Ops dynamic quantization emits; a graph without any of them was left as FP32
+INT8_OPS = {'MatMulInteger', 'DynamicQuantizeLinear', 'ConvInteger', 'QLinearMatMul'}
+
+
+def quantize_onnx(onnx_path):
+    """
+    INT8 copy next to the FP32 file, named *.int8.onnx like the upload path in
+    zkml_simulator (dynamic quantization -> QOperator MatMulInteger, not QDQ,
+    which gives no speedup on models this small)
+    Returns None when nothing was quantized (e.g. skl2onnx LinearClassifier
+    graphs have no MatMul/Gemm nodes)
+    """
+    from onnxruntime.quantization import quantize_dynamic, QuantType
+    int8_path = os.path.splitext(onnx_path)[0] + '.int8.onnx'
+    quantize_dynamic(onnx_path, int8_path, weight_type=QuantType.QInt8, op_types_to_quantize=['MatMul', 'Gemm'])
+    if not any(node.op_type in INT8_OPS for node in onnx.load(int8_path).graph.node):
+        os.remove(int8_path)
+        return None
+    return int8_path
+
+
+def verify_onnx(onnx_path, reference):
+    """Compare the built graph against its float reference"""
+    session = ort.InferenceSession(onnx_path, providers=['CPUExecutionProvider'])
+    test_input = np.array([[5.1, 3.5, 1.4, 0.2]], dtype=np.float32)  # Iris-like input
+    result = session.run(None, {'input': test_input})[-1]
+    expected = reference(test_input)
+    print(f"   Test output: {result} (float reference: {expected})")
+    print(f"   Predicted class: {np.argmax(result)} (float reference: {np.argmax(expected)})")
+
+
+def build_and_register(spec, by_id):
+    """Build one spec, save/optimize/quantize it and upsert its models.json record"""
+    print(f"Building {spec['id']} ({spec['arch']})...")
+    model, reference = BUILDERS[spec['arch']](spec)
+    onnx.checker.check_model(model)
+
+    onnx_path = os.path.join(MODELS_DIR, spec['file'])
+    onnx.save(model, onnx_path)
+    print(f"   Saved: {onnx_path}")
+
+    metadata = {
+        'format': 'onnx',
+        'ezkl_enabled': True,
+        'real_zkml': True,
+        'input_size': spec['input_size'],
+        'output_size': spec['output_size'],
+        'classes': CLASSES,
+    }
+    verify_path = onnx_path
+
+    if spec['arch'] == 'int8_linear':
+        metadata['quantization'] = 'int8-weights'
+
+    if ort is not None:
+        optimize_onnx(onnx_path)
+        int8_path = quantize_onnx(onnx_path) if spec['quantize'] else None
+        if int8_path:
+            # file_path stays FP32; the serving path prefers metadata.int8_path when present
+            verify_path = metadata['int8_path'] = int8_path
+            metadata['quantization'] = 'int8-dynamic'
+            print(f"   Quantized: {verify_path}")
+        elif spec['quantize']:
+            print("   No MatMul/Gemm to quantize, keeping FP32 only")
+        if VERIFY:
+            verify_onnx(verify_path, reference)
+
+    # Rebuilds keep the record's usage stats and creation date (incl. migrated ones)
+    existing = by_id.get(spec['id'], {})
+    by_id[spec['id']] = {
+        'id': spec['id'],
+        'name': spec['name'],
+        'description': spec['description'],
+        'model_type': 'classification',
+        'is_public': True,
+        'owner_id': 'demo-user',
+        'file_path': onnx_path,
+        'metadata': metadata,
+        'total_inferences': existing.get('total_inferences', 0),
+        'average_latency_ms': existing.get('average_latency_ms', 0),
+        'created_at': existing.get('created_at', '2026-01-08T12:00:00Z')
+    }
+
+
+LEGACY_ID = 'model-onnx-zkml'
+
+
+def migrate_legacy_record(by_id):
+    """
+    If 'model-onnx-zkml' still points at a graph that now has its own id, move
+    the record (and its usage stats) over before the MLP takes the id back
+    """
+    record = by_id.get(LEGACY_ID)
+    if not record:
+        return
+    stem = os.path.basename(record.get('file_path', '')).split('.')[0].removesuffix('_int8')
+    for spec in SPECS:
+        if spec['id'] != LEGACY_ID and os.path.splitext(spec['file'])[0] == stem:
+            moved = by_id.setdefault(spec['id'], dict(record, id=spec['id']))
+            moved['total_inferences'] = record.get('total_inferences', 0)
+            moved['average_latency_ms'] = record.get('average_latency_ms', 0)
+            # The stats moved with the graph; the MLP starts from zero under the old id
+            record['total_inferences'] = 0
+            record['average_latency_ms'] = 0
+            print(f"[INFO] {LEGACY_ID} pointed at {spec['file']}, migrated it to {spec['id']}")
+            return
+
+
+def load_db():
+    with open(MODELS_PATH, 'rb') as f:
+        return orjson.loads(f.read())
+
+
+def save_db(models):
+    # Atomic write: temp file + rename, so a crash never leaves a torn models.json
+    tmp_path = MODELS_PATH + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(orjson.dumps(models, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+    os.replace(tmp_path, MODELS_PATH)
+
+
+if __name__ == '__main__':
+    selected = set(sys.argv[1:])
+    specs = [s for s in SPECS if not selected or s['id'] in selected]
+
+    print("Creating ONNX models for EZKL...")
+    os.makedirs(MODELS_DIR, exist_ok=True)
+
+    by_id = {m['id']: m for m in load_db()}
+    migrate_legacy_record(by_id)
+    for spec in specs:
+        build_and_register(spec, by_id)
+    save_db(list(by_id.values()))
+
+    print(f"\n✅ Registered {len(specs)} ONNX model(s), ready for EZKL SNARK proofs!")
@@ -10,9 +10,11 @@ import argparse
 from typing import Optional
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 
 from app.api import models, inference, marketplace, users, workers, training
+from app.core.config import FRONTEND_ORIGINS
 
 # ============ Tunneling Manager ============
 
@@ -74,10 +76,10 @@ async def lifespan(app: FastAPI):
     print("[INFO] Initializing storage...")
     print("[SUCCESS] ZKML Simulator ready")
     
-    # Seed demo data for presentation
+    # Seed demo data for presentation (no-op once storage/.seeded_v<N> exists)
     # from app.core.database import db
-    # from app.core.demo_data import seed_demo_data
-    # seed_demo_data(db)
+    # from app.core.demo_data import seed_demo_data_once
+    # seed_demo_data_once(db)
     
     print("[SUCCESS] Backend ready to accept connections")
     yield
@@ -106,16 +108,17 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
-# Configure CORS
+# Configure CORS (explicit allowlist - set FRONTEND_ORIGIN to override)
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production, specify exact origins
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=FRONTEND_ORIGINS,
+    allow_credentials=False,
+    allow_methods=["GET", "POST", "PUT", "DELETE"],
+    allow_headers=["content-type", "authorization"],
 )
 
 # Include routers
@@ -161,24 +164,22 @@ async def get_platform_stats():
     """Get platform-wide statistics"""
     from app.core.database import db
     
-    users = db._read_file(db.users_file)
-    models = db._read_file(db.models_file)
-    jobs = db._read_file(db.jobs_file)
+    counters = db.get_counters()
     listings = db.get_active_listings()
     
-    completed_jobs = [j for j in jobs if j.get("status") == "completed"]
-    verified_jobs = [j for j in jobs if j.get("status") == "verified" or j.get("proof_hash")]
+    completed = counters.get("completed_inferences", 0)
+    verified = counters.get("verified_inferences", 0)
     
     return {
         "platform": "V-Inference",
         "stats": {
-            "total_users": len(users),
-            "total_models": len(models),
-            "total_inferences": len(jobs),
-            "completed_inferences": len(completed_jobs),
-            "verified_inferences": len(verified_jobs),
+            "total_users": counters.get("total_users", 0),
+            "total_models": counters.get("total_models", 0),
+            "total_inferences": counters.get("total_inferences", 0),
+            "completed_inferences": completed,
+            "verified_inferences": verified,
             "active_listings": len(listings),
-            "verification_rate": round(len(verified_jobs) / max(len(completed_jobs), 1) * 100, 2)
+            "verification_rate": round(verified / max(completed, 1) * 100, 2)
         },
         "network": {
             "chain": "Base Shardeum",
@@ -199,4 +200,6 @@ if __name__ == "__main__":
         tunnel = TunnelManager(port=args.port)
         tunnel.start()
 
+    # uvicorn's default loop/http="auto" already pick uvloop + httptools when
+    # uvicorn[standard] is installed, and fall back to asyncio/h11 otherwise
     uvicorn.run(app, host="0.0.0.0", port=args.port)
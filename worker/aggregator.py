@@ -9,6 +9,8 @@ from supabase import create_client, Client
 from dotenv import load_dotenv
 from datetime import datetime
 
+from checkpoint import load_state_dict
+
 load_dotenv()
 
 # Configuration - SECURITY: Ensure these are set via environment variables
@@ -50,8 +52,7 @@ async def aggregate_updates(supabase: Client, job_id: int) -> dict:
             response = requests.get(update_url, timeout=30)
             response.raise_for_status()
             
-            weights_buffer = io.BytesIO(response.content)
-            state_dict = torch.load(weights_buffer, map_location='cpu', weights_only=True)
+            state_dict = load_state_dict(response.content)
             
             if aggregated_state is None:
                 # Initialize with first model's structure
@@ -5,11 +5,13 @@ Uses OblivionManagerSimple contract
 """
 import os
 import time
+import threading
 from typing import Optional, List, Dict, Any
 from dataclasses import dataclass
 from enum import IntEnum
 from web3 import Web3
 from web3.middleware import ExtraDataToPOAMiddleware
+from web3.exceptions import TransactionNotFound
 from eth_account import Account
 from dotenv import load_dotenv
 
@@ -317,6 +319,16 @@ class BlockchainClient:
         else:
             self.inco_contract = None
         
+        # Output types per view function, for decoding raw eth_call results in batch_call
+        self._output_types = {
+            entry['name']: [o['type'] for o in entry['outputs']]
+            for entry in OBLIVION_ABI if entry.get('type') == 'function'
+        }
+        
+        # Locally tracked nonce, so several transactions can be in flight at once
+        self._nonce: Optional[int] = None
+        self._nonce_lock = threading.Lock()
+        
         print(f"✅ Blockchain client initialized")
         print(f"   RPC: {self.rpc_url[:40]}...")
         print(f"   Contract: {self.contract_address}")
@@ -349,13 +361,22 @@ class BlockchainClient:
             node_id=worker_data[4]
         )
     
-    def _send_transaction(self, func, value: int = 0) -> str:
-        """Send a transaction and wait for receipt"""
+    def _next_nonce(self) -> int:
+        """Next nonce to use: the node's pending count, or past our own unmined sends"""
+        with self._nonce_lock:
+            pending = self.w3.eth.get_transaction_count(self.address, 'pending')
+            self._nonce = max(pending, self._nonce or 0)
+            nonce = self._nonce
+            self._nonce += 1
+            return nonce
+    
+    def _send_transaction_nowait(self, func, value: int = 0) -> Optional[str]:
+        """Sign and broadcast a transaction; returns its hash without waiting for a receipt"""
         try:
             # Build transaction
             tx = func.build_transaction({
                 'from': self.address,
-                'nonce': self.w3.eth.get_transaction_count(self.address),
+                'nonce': self._next_nonce(),
                 'gas': 500000,
                 'gasPrice': int(self.w3.eth.gas_price * 1.2),
                 'value': value
@@ -365,13 +386,28 @@ class BlockchainClient:
             signed = self.w3.eth.account.sign_transaction(tx, self.private_key)
             tx_hash = self.w3.eth.send_raw_transaction(signed.raw_transaction)
             print(f"📤 Transaction sent: {tx_hash.hex()[:20]}...")
+            return tx_hash.hex()
             
+        except Exception as e:
+            # The nonce may not have been consumed - resync from the node next time
+            with self._nonce_lock:
+                self._nonce = None
+            print(f"❌ Transaction error: {e}")
+            return None
+    
+    def _send_transaction(self, func, value: int = 0) -> str:
+        """Send a transaction and wait for receipt"""
+        tx_hash = self._send_transaction_nowait(func, value)
+        if tx_hash is None:
+            return None
+        
+        try:
             # Wait for receipt
             receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
             
             if receipt['status'] == 1:
                 print(f"✅ Transaction confirmed in block {receipt['blockNumber']}")
-                return tx_hash.hex()
+                return tx_hash
             else:
                 print(f"❌ Transaction failed")
                 return None
@@ -380,6 +416,40 @@ class BlockchainClient:
             print(f"❌ Transaction error: {e}")
             return None
     
+    def reap_receipts(self, tx_hashes) -> Dict[str, bool]:
+        """
+        Check which of `tx_hashes` have been mined, in one JSON-RPC batch
+        Returns {tx_hash: succeeded} for mined transactions; still-pending ones are omitted
+        """
+        tx_hashes = list(tx_hashes)
+        if not tx_hashes:
+            return {}
+        
+        try:
+            if hasattr(self.w3.provider, 'make_batch_request'):
+                # web3 v7: one HTTP round-trip for every receipt
+                responses = self.w3.provider.make_batch_request(
+                    [('eth_getTransactionReceipt', [h if h.startswith('0x') else '0x' + h]) for h in tx_hashes]
+                )
+                receipts = [r.get('result') for r in responses]
+            else:
+                receipts = []
+                for h in tx_hashes:
+                    try:
+                        receipts.append(self.w3.eth.get_transaction_receipt(h))
+                    except TransactionNotFound:
+                        receipts.append(None)
+        except Exception as e:
+            print(f"❌ Error fetching receipts: {e}")
+            return {}
+        
+        # Raw batch results carry hex strings, web3 receipts carry ints
+        return {
+            h: int(receipt['status'], 16) == 1 if isinstance(receipt['status'], str) else receipt['status'] == 1
+            for h, receipt in zip(tx_hashes, receipts)
+            if receipt
+        }
+    
     # ========== Worker Functions ==========
     
     def register_worker(self, node_id: str, stake_wei: int) -> bool:
@@ -453,6 +523,14 @@ class BlockchainClient:
         result = self._send_transaction(func)
         return result is not None
     
+    def submit_result_nowait(self, job_id: int, model_hash: str) -> Optional[str]:
+        """Broadcast a result submission and return its tx hash (confirm via reap_receipts)"""
+        print(f"📤 Submitting result for job #{job_id}")
+        print(f"   Model hash: {model_hash[:50]}...")
+        
+        func = self.contract.functions.submitResult(job_id, model_hash)
+        return self._send_transaction_nowait(func)
+    
     def cancel_job(self, job_id: int) -> bool:
         """Cancel a pending job (only requester can call)"""
         print(f"❌ Cancelling job #{job_id}")
@@ -472,6 +550,44 @@ class BlockchainClient:
             print(f"❌ Error getting job {job_id}: {e}")
             return None
     
+    def batch_call(self, calls: List[tuple]) -> List[Any]:
+        """
+        Run several view calls - (function_name, *args) tuples - in one JSON-RPC batch
+        Results come back in order, shaped like .call() (scalar for single outputs)
+        """
+        if not hasattr(self.w3.provider, 'make_batch_request'):
+            # web3 < 7: no batch support on the provider, one round-trip per call
+            return [getattr(self.contract.functions, name)(*args).call() for name, *args in calls]
+        
+        encode = getattr(self.contract, 'encode_abi', None) or self.contract.encodeABI
+        rpc_calls = [
+            ('eth_call', [{'to': self.contract.address, 'data': encode(name, args=list(args))}, 'latest'])
+            for name, *args in calls
+        ]
+        results = []
+        for (name, *_), response in zip(calls, self.w3.provider.make_batch_request(rpc_calls)):
+            if 'error' in response:
+                raise ValueError(f"{name} failed: {response['error']}")
+            decoded = self.w3.codec.decode(self._output_types[name], bytes.fromhex(response['result'][2:]))
+            results.append(decoded[0] if len(decoded) == 1 else decoded)
+        return results
+    
+    def poll_state(self) -> tuple:
+        """
+        Pending jobs and this worker's info in two batched round-trips
+        (job count + worker, then every job) instead of one call per job
+        Returns (pending_jobs, worker) - worker is None if it can't be read
+        """
+        try:
+            job_count, worker_data = self.batch_call([('getJobCount',), ('getWorker', self.address)])
+            job_data = self.batch_call([('getJob', i) for i in range(job_count)]) if job_count else []
+        except Exception as e:
+            print(f"❌ Error polling chain state: {e}")
+            return [], None
+        
+        jobs = [self._parse_job(i, data) for i, data in enumerate(job_data)]
+        return [j for j in jobs if j.is_pending], self._parse_worker(self.address, worker_data)
+    
     def get_job_count(self) -> int:
         """Get total number of jobs"""
         try:
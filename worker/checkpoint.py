@@ -0,0 +1,78 @@
+"""
+Checkpoint I/O for Oblivion workers
+Packed checkpoints carry bf16 float weights and are zstd (else gzip) compressed;
+load_state_dict also accepts plain torch.save output, so every loader can use it.
+"""
+
+import io
+import gzip
+from typing import Dict, Any
+
+import torch
+
+# zstd is optional - checkpoints fall back to gzip without it
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+CHECKPOINT_DTYPE = torch.bfloat16  # float weights are shipped at half width
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def pack_checkpoint(checkpoint: Dict[str, Any]) -> io.BytesIO:
+    """Serialize a checkpoint with bf16 float weights, compressed (zstd, else gzip)"""
+    checkpoint = dict(checkpoint)
+    checkpoint['model_state_dict'] = {
+        k: v.to(CHECKPOINT_DTYPE).contiguous() if v.is_floating_point() else v
+        for k, v in checkpoint['model_state_dict'].items()
+    }
+    checkpoint['weights_dtype'] = str(CHECKPOINT_DTYPE)
+
+    checkpoint['compression'] = 'zstd' if zstandard is not None else 'gzip'
+    raw = io.BytesIO()
+    # Zip format: tensor storages are written as raw records, never through the pickle
+    # stream, so a higher pickle_protocol would save nothing - and weights_only loaders
+    # on torch < 2.4 only accept protocol 2
+    torch.save(checkpoint, raw, _use_new_zipfile_serialization=True)
+    if zstandard is not None:
+        packed = zstandard.ZstdCompressor(level=3).compress(raw.getbuffer())
+    else:
+        packed = gzip.compress(raw.getbuffer(), compresslevel=3)
+    return io.BytesIO(packed)
+
+
+def _decompress(data: bytes) -> bytes:
+    """Strip zstd/gzip compression by magic bytes; anything else is returned as is"""
+    if data.startswith(ZSTD_MAGIC):
+        if zstandard is None:
+            raise RuntimeError("zstd-compressed checkpoint, but zstandard is not installed")
+        return zstandard.ZstdDecompressor().decompress(data)
+    if data.startswith(GZIP_MAGIC):
+        return gzip.decompress(data)
+    return data
+
+
+def load_checkpoint(data: bytes) -> Dict[str, Any]:
+    """Inverse of pack_checkpoint: decompress by magic bytes, cast weights back to fp32"""
+    checkpoint = torch.load(io.BytesIO(_decompress(data)), map_location='cpu', weights_only=True)
+    checkpoint['model_state_dict'] = {
+        k: v.float() if v.is_floating_point() else v
+        for k, v in checkpoint['model_state_dict'].items()
+    }
+    return checkpoint
+
+
+def load_state_dict(data: bytes) -> Dict[str, torch.Tensor]:
+    """
+    Model weights from either a packed checkpoint or a plain torch.save'd state dict
+    Packed bf16 weights are cast back to fp32.
+    """
+    loaded = torch.load(io.BytesIO(_decompress(data)), map_location='cpu', weights_only=True)
+    if isinstance(loaded, dict) and 'model_state_dict' in loaded:
+        loaded = loaded['model_state_dict']
+        if isinstance(loaded, dict):
+            loaded = {k: v.float() if v.is_floating_point() else v for k, v in loaded.items()}
+    return loaded
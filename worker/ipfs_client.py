@@ -5,8 +5,11 @@ Unified IPFS client supporting Pinata for decentralized storage
 
 import os
 import json
+import uuid
+import hashlib
 import requests
-from typing import Optional, Dict, Any
+from requests.adapters import HTTPAdapter
+from typing import Optional, Dict, Any, BinaryIO
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -24,6 +27,9 @@ PUBLIC_GATEWAY = "https://ipfs.io/ipfs/"
 PINATA_PIN_FILE_URL = "https://api.pinata.cloud/pinning/pinFileToIPFS"
 PINATA_PIN_JSON_URL = "https://api.pinata.cloud/pinning/pinJSONToIPFS"
 
+# (connect, read) for streamed uploads; the read timeout applies between chunks
+UPLOAD_TIMEOUT = (10, 120)
+
 
 class IPFSClient:
     """
@@ -39,6 +45,12 @@ class IPFSClient:
         # Check configuration
         self.is_configured = bool(self.api_key and self.secret_key) or bool(self.jwt)
         
+        # One keep-alive session for Pinata and the gateways - no TCP/TLS setup per call
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=8)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        
         if self.is_configured:
             print("✅ IPFS client initialized (Pinata)")
         else:
@@ -79,7 +91,7 @@ class IPFSClient:
                     "pinataOptions": json.dumps(options)
                 }
                 
-                response = requests.post(
+                response = self.session.post(
                     PINATA_PIN_FILE_URL,
                     files=files,
                     data=data,
@@ -112,7 +124,7 @@ class IPFSClient:
             import io
             files = {"file": (name, io.BytesIO(data))}
             
-            response = requests.post(
+            response = self.session.post(
                 PINATA_PIN_FILE_URL,
                 files=files,
                 headers=self._get_headers()
@@ -131,6 +143,56 @@ class IPFSClient:
             print(f"❌ IPFS pin error: {e}")
             return None
     
+    def upload_fileobj(self, fileobj: BinaryIO, name: str = "file", chunk_size: int = 256 * 1024) -> Optional[str]:
+        """
+        Pin a file-like object to IPFS without touching disk
+        The multipart body is streamed with chunked transfer encoding
+        """
+        if not self.is_configured:
+            # Simulation mode
+            digest = hashlib.sha256()
+            for chunk in iter(lambda: fileobj.read(chunk_size), b""):
+                digest.update(chunk)
+            fake_hash = "Qm" + digest.hexdigest()[:44]
+            print(f"📤 [SIMULATED] Pinned stream: {fake_hash}")
+            return fake_hash
+        
+        boundary = uuid.uuid4().hex
+        
+        def body():
+            # Hand-rolled multipart/form-data so requests sends it as a generator (chunked)
+            yield (
+                f"--{boundary}\r\n"
+                f'Content-Disposition: form-data; name="pinataMetadata"\r\n\r\n'
+                f"{json.dumps({'name': name})}\r\n"
+                f"--{boundary}\r\n"
+                f'Content-Disposition: form-data; name="file"; filename="{name}"\r\n'
+                f"Content-Type: application/octet-stream\r\n\r\n"
+            ).encode()
+            for chunk in iter(lambda: fileobj.read(chunk_size), b""):
+                yield chunk
+            yield f"\r\n--{boundary}--\r\n".encode()
+        
+        try:
+            response = self.session.post(
+                PINATA_PIN_FILE_URL,
+                data=body(),
+                headers={**self._get_headers(), "Content-Type": f"multipart/form-data; boundary={boundary}"},
+                timeout=UPLOAD_TIMEOUT
+            )
+            
+            if response.status_code == 200:
+                ipfs_hash = response.json().get("IpfsHash")
+                print(f"✅ Pinned stream to IPFS: {ipfs_hash}")
+                return ipfs_hash
+            else:
+                print(f"❌ Pinata error: {response.status_code} - {response.text}")
+                return None
+                
+        except Exception as e:
+            print(f"❌ IPFS pin error: {e}")
+            return None
+    
     def pin_json(self, data: Dict[str, Any], name: str = "data.json") -> Optional[str]:
         """Pin JSON data to IPFS"""
         if not self.is_configured:
@@ -147,7 +209,7 @@ class IPFSClient:
                 "pinataMetadata": {"name": name}
             }
             
-            response = requests.post(
+            response = self.session.post(
                 PINATA_PIN_JSON_URL,
                 json=payload,
                 headers={**self._get_headers(), "Content-Type": "application/json"}
@@ -171,14 +233,14 @@ class IPFSClient:
         try:
             # Try Pinata gateway first
             url = f"{PINATA_GATEWAY}{ipfs_hash}"
-            response = requests.get(url, timeout=30)
+            response = self.session.get(url, timeout=30)
             
             if response.status_code == 200:
                 return response.content
             
             # Fallback to public gateway
             url = f"{PUBLIC_GATEWAY}{ipfs_hash}"
-            response = requests.get(url, timeout=30)
+            response = self.session.get(url, timeout=30)
             
             if response.status_code == 200:
                 return response.content
@@ -190,6 +252,31 @@ class IPFSClient:
             print(f"❌ IPFS get error: {e}")
             return None
     
+    def download_to_file(self, ipfs_hash: str, dest_path: str, chunk_size: int = 1 << 20) -> Optional[str]:
+        """
+        Stream a file from IPFS straight to disk (no full in-memory copy)
+        Returns the BLAKE2b-256 hex digest of the content on success, None on failure
+        """
+        tmp_path = f"{dest_path}.part"
+        for gateway in (PINATA_GATEWAY, PUBLIC_GATEWAY):
+            try:
+                with self.session.get(f"{gateway}{ipfs_hash}", stream=True, timeout=30) as response:
+                    if response.status_code != 200:
+                        continue
+                    # Hash while writing - no second pass over the payload
+                    h = hashlib.blake2b(digest_size=32)
+                    with open(tmp_path, "wb") as f:
+                        for chunk in response.iter_content(chunk_size=chunk_size):
+                            h.update(chunk)
+                            f.write(chunk)
+                os.replace(tmp_path, dest_path)
+                return h.hexdigest()
+            except Exception as e:
+                print(f"❌ IPFS download error ({gateway}): {e}")
+        
+        print(f"❌ Failed to fetch from IPFS: {ipfs_hash}")
+        return None
+    
     def get_json(self, ipfs_hash: str) -> Optional[Dict[str, Any]]:
         """Download and parse JSON from IPFS"""
         content = self.get_file(ipfs_hash)
@@ -205,6 +292,20 @@ class IPFSClient:
         return f"{PINATA_GATEWAY}{ipfs_hash}"
 
 
+def blake2b_file(path: str, chunk_size: int = 1 << 20) -> str:
+    """BLAKE2b-256 hex digest of a file, streamed through one reusable buffer"""
+    h = hashlib.blake2b(digest_size=32)
+    buf = bytearray(chunk_size)
+    view = memoryview(buf)
+    with open(path, "rb", buffering=0) as f:
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            h.update(view[:n])
+    return h.hexdigest()
+
+
 # Global client instance
 _client: Optional[IPFSClient] = None
 
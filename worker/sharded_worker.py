@@ -19,6 +19,8 @@ from datetime import datetime
 import io
 import hashlib
 
+from checkpoint import load_state_dict
+
 # Import network configuration
 try:
     from network_config import (
@@ -967,7 +969,8 @@ async def main():
                                 # Load weights if saved
                                 weights_path = '/tmp/sandbox_weights.pt'
                                 if sandbox_result.get('weights_saved') and os.path.exists(weights_path):
-                                    weights = torch.load(weights_path, map_location='cpu', weights_only=True)
+                                    with open(weights_path, 'rb') as f:
+                                        weights = load_state_dict(f.read())
                                     os.unlink(weights_path)
                                 else:
                                     module = nn.Sequential(nn.Linear(10, 32), nn.ReLU(), nn.Linear(32, 1))
@@ -1096,8 +1099,7 @@ async def main():
                                     print(f"    - Downloading weights from {model_url}")
                                     r = requests.get(model_url, timeout=30)
                                     r.raise_for_status()
-                                    weights_buffer = io.BytesIO(r.content)
-                                    state_dict = torch.load(weights_buffer, map_location='cpu', weights_only=True)
+                                    state_dict = load_state_dict(r.content)
                                     
                                     # Reconstruct model from state dict
                                     if '0.weight' in state_dict: